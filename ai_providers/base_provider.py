@@ -6,7 +6,8 @@ Base AI Provider Class
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from io import BytesIO
+from typing import Optional, Tuple
 from PIL import Image
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,13 @@ logger = logging.getLogger(__name__)
 class BaseAIProvider(ABC):
     """Base class for AI providers"""
     
+    # Screenshots are uploaded as JPEG: several times smaller than PNG
+    IMAGE_MIME = "image/jpeg"
+    JPEG_QUALITY = 80
+    
+    # Bounding box the model works at; larger screenshots are downscaled locally
+    INPUT_SIZE: Optional[Tuple[int, int]] = (1280, 1280)
+    
     def __init__(self, api_key: str = ""):
         self.api_key = api_key
         self.name = "BaseProvider"
@@ -44,6 +52,29 @@ class BaseAIProvider(ABC):
         """
         pass
     
+    def preferred_input_size(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the largest image size worth sending to this provider
+        
+        Returns:
+            (width, height) bounding box, or None to send full resolution
+        """
+        return self.INPUT_SIZE
+    
+    def _encode_image(self, image: Image.Image) -> bytes:
+        """
+        Encode screenshot for upload
+        
+        Args:
+            image: PIL Image to encode
+        
+        Returns:
+            JPEG bytes
+        """
+        buffered = BytesIO()
+        image.convert("RGB").save(buffered, format="JPEG", quality=self.JPEG_QUALITY, optimize=False)
+        return buffered.getvalue()
+    
     def test_connection(self) -> bool:
         """
         Test connection to AI provider
@@ -6,7 +6,6 @@ Anthropic Claude Vision Provider
 
 import logging
 import base64
-from io import BytesIO
 from typing import Optional
 from PIL import Image
 
@@ -25,6 +24,8 @@ logger = logging.getLogger(__name__)
 class ClaudeProvider(BaseAIProvider):
     """Anthropic Claude Vision provider"""
     
+    INPUT_SIZE = (1568, 1568)
+    
     def __init__(self, api_key: str = ""):
         super().__init__(api_key)
         self.name = "Claude"
@@ -51,9 +52,7 @@ class ClaudeProvider(BaseAIProvider):
     
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL Image to base64 string"""
-        buffered = BytesIO()
-        image.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode()
+        return base64.b64encode(self._encode_image(image)).decode()
     
     def analyze_screen(self, image: Image.Image, instruction: str) -> Optional[str]:
         """Analyze screen with Claude Vision"""
@@ -92,7 +91,7 @@ Be specific with coordinates and actions."""
                                 "type": "image",
                                 "source": {
                                     "type": "base64",
-                                    "media_type": "image/png",
+                                    "media_type": self.IMAGE_MIME,
                                     "data": base64_image
                                 }
                             },
@@ -72,7 +72,9 @@ Respond with clear, executable steps using these actions:
 
 Be specific with coordinates and actions."""
             
-            response = self.model.generate_content([prompt, image])
+            # Inline JPEG bytes: the SDK sends them as-is, no second encode
+            image_part = {"mime_type": self.IMAGE_MIME, "data": self._encode_image(image)}
+            response = self.model.generate_content([prompt, image_part])
             return response.text
             
         except Exception as e:
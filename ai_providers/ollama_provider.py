@@ -6,7 +6,6 @@ Ollama Local AI Provider
 
 import logging
 import base64
-from io import BytesIO
 from typing import Optional
 from PIL import Image
 
@@ -66,9 +65,7 @@ class OllamaProvider(BaseAIProvider):
     
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL Image to base64 string"""
-        buffered = BytesIO()
-        image.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode()
+        return base64.b64encode(self._encode_image(image)).decode()
     
     def analyze_screen(self, image: Image.Image, instruction: str) -> Optional[str]:
         """Analyze screen with Ollama Vision"""
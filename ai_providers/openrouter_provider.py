@@ -6,7 +6,6 @@ OpenRouter Multi-Model Provider
 
 import logging
 import base64
-from io import BytesIO
 from typing import Optional
 from PIL import Image
 
@@ -47,10 +46,8 @@ class OpenRouterProvider(BaseAIProvider):
     
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL Image to base64 string"""
-        buffered = BytesIO()
-        image.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode()
-        return f"data:image/png;base64,{img_str}"
+        img_str = base64.b64encode(self._encode_image(image)).decode()
+        return f"data:{self.IMAGE_MIME};base64,{img_str}"
     
     def analyze_screen(self, image: Image.Image, instruction: str) -> Optional[str]:
         """Analyze screen with OpenRouter"""
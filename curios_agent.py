@@ -13,12 +13,18 @@ PRODUCTION-READY RELEASE - No placeholders, no TODO, no pass statements.
 import os
 import sys
 import json
+import asyncio
+import copy
 import time
 import logging
 import platform
 import threading
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from functools import partial
+from hashlib import blake2b
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
@@ -36,6 +42,23 @@ except ImportError as e:
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional: KeyWin (Win32 SendInput, releases the GIL) for fast text input
+KEYWIN_AVAILABLE = False
+if platform.system() == "Windows":
+    try:
+        from keywin import keyboard as _kw_keyboard
+        KEYWIN_AVAILABLE = True
+    except ImportError:
+        _kw_keyboard = None
+
+# Optional: RE2 for linear-time matching of untrusted AI output
+try:
+    import re2 as _re
+    RE2_AVAILABLE = True
+except ImportError:
+    _re = re
+    RE2_AVAILABLE = False
+
 # ============================================================================
 # CONSTANTS AND CONFIGURATION
 # ============================================================================
@@ -62,6 +85,9 @@ try:
     from ui.theme import Theme
     from ui.dialogs import LegalDialog, EULADialog, show_error_dialog, show_info_dialog
     UI_AVAILABLE = True
+    # Read the legal documents in the background before any dialog needs them
+    LegalDialog.prefetch()
+    EULADialog.prefetch()
 except ImportError:
     print("Warning: UI modules not available, using legacy UI")
     UI_AVAILABLE = False
@@ -104,6 +130,35 @@ else:
         "text_dim": "#94a3b8"
     }
 
+# Widget fonts (shared tuples instead of a new literal per widget)
+FONT_SMALL = ("Arial", 10)
+FONT_TEXT = ("Arial", 12)
+FONT_LBL = ("Arial", 12, "bold")
+FONT_PROMPT = ("Arial", 14)
+FONT_BTN = ("Arial", 14, "bold")
+
+# Parsed AI responses kept for repeated instructions
+PARSED_ACTION_CACHE_SIZE = 32
+
+# Settings tab entry rows: (label, key, show char); API keys are masked
+SETTINGS_ENTRY_ROWS = (
+    ("Gemini API Key:", "gemini", "*"),
+    ("OpenAI API Key:", "openai", "*"),
+    ("Claude API Key:", "claude", "*"),
+    ("Ollama Host:", "ollama_host", ""),
+)
+
+# Control tab quick actions: (icon, translation key, instruction)
+QUICK_ACTIONS = (
+    ("🌐", "browser", "Open web browser"),
+    ("📝", "notepad", "Open notepad"),
+    ("📁", "explorer", "Open file explorer"),
+    ("📷", "screenshot", "Take screenshot"),
+)
+
+# Lines kept in the logs tab; older output is dropped from the widget
+LOG_VIEW_MAX_LINES = 10000
+
 # AI Provider priority for fallback
 PROVIDER_PRIORITY = ["ollama", "gemini", "openai", "claude"]
 
@@ -169,6 +224,8 @@ TRANSLATIONS = {
         "self_protection": "Cannot modify protected files",
         "confirm_action": "Confirm Action",
         "confirm_message": "Allow this action?",
+        "yes": "Yes",
+        "no": "No",
         "legal_notice_title": "Legal Notice",
         "legal_notice_accept": "I have read and agree",
         "legal_notice_decline": "Decline",
@@ -219,6 +276,8 @@ TRANSLATIONS = {
         "self_protection": "Невозможно изменить защищённые файлы",
         "confirm_action": "Подтверждение Действия",
         "confirm_message": "Разрешить это действие?",
+        "yes": "Да",
+        "no": "Нет",
         "legal_notice_title": "Правовое уведомление",
         "legal_notice_accept": "Я прочитал и согласен",
         "legal_notice_decline": "Отклонить",
@@ -272,11 +331,12 @@ class ConfigManager:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     # Merge with defaults
-                    return {**self.DEFAULT_CONFIG, **config}
+                    return {**copy.deepcopy(self.DEFAULT_CONFIG), **config}
         except Exception as e:
             logging.warning(f"Failed to load config: {e}")
         
-        return self.DEFAULT_CONFIG.copy()
+        # Deep copy so nested defaults (api_keys, custom_actions) are never shared
+        return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def save(self) -> bool:
         """Save configuration to file"""
@@ -292,6 +352,10 @@ class ConfigManager:
         """Get configuration value"""
         return self.config.get(key, default)
     
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a shallow copy of the current configuration"""
+        return dict(self.config)
+    
     def set(self, key: str, value: Any):
         """Set configuration value"""
         self.config[key] = value
@@ -326,6 +390,72 @@ logger = logging.getLogger(__name__)
 # AGENT CORE
 # ============================================================================
 
+# Verbs execute_action understands (tuple for a single str.startswith call)
+ACTION_VERBS = (
+    'move_mouse', 'click', 'double_click', 'drag',
+    'type_text', 'press_key', 'hotkey', 'scroll', 'wait'
+)
+
+# Action patterns (compiled once; RE2-backed when available)
+_MOVE_MOUSE_RE = _re.compile(r'move_mouse\((\d+),\s*(\d+)\)')
+_CLICK_RE = _re.compile(r"click\(button=['\"](\w+)['\"]\)")
+_DRAG_RE = _re.compile(r'drag\((\d+),\s*(\d+),\s*(\d+),\s*(\d+)\)')
+_TYPE_TEXT_RE = _re.compile(r'type_text\(["\'](.+?)["\']\)')
+_PRESS_KEY_RE = _re.compile(r'press_key\(["\'](.+?)["\']\)')
+_HOTKEY_RE = _re.compile(r'hotkey\(["\'](.+?)["\'],\s*["\'](.+?)["\']\)')
+_SCROLL_RE = _re.compile(r'scroll\((-?\d+)\)')
+_WAIT_RE = _re.compile(r'wait\((\d+(?:\.\d+)?)\)')
+
+
+def _parse_seconds(value: str) -> float:
+    """Parse seconds written as digits with an optional ".digits" fraction"""
+    whole, dot, fraction = value.partition(".")
+    if not whole.isdecimal() or (dot and not fraction.isdecimal()):
+        raise ValueError(value)
+    return float(value)
+
+
+def _parse_count(value: str) -> int:
+    """Parse a non-negative integer written as plain digits"""
+    if not value.isdecimal():
+        raise ValueError(value)
+    return int(value)
+
+
+def _parse_offset(value: str) -> int:
+    """Parse an integer written as plain digits with an optional minus sign"""
+    if not value.removeprefix("-").isdecimal():
+        raise ValueError(value)
+    return int(value)
+
+
+def _parse_call_args(action: str, verb: str, count: int, cast=_parse_count) -> Optional[list]:
+    """
+    Parse numeric arguments of "verb(a, b, ...)" without a regex
+    
+    Accepts exactly what the action regexes accept: whitespace only after
+    a comma, digits as matched by \\d, and a "-" sign or ".digits"
+    fraction only where cast allows it.
+    
+    Returns:
+        List of parsed values, or None if the action has a different shape
+    """
+    start = len(verb) + 1
+    if action[start - 1:start] != "(":
+        return None
+    end = action.find(")", start)
+    if end < 0:
+        return None
+    parts = action[start:end].split(",")
+    if len(parts) != count:
+        return None
+    try:
+        # Mirrors ",\\s*" in the regexes: the first argument gets no padding
+        return [cast(parts[0]), *(cast(part.lstrip()) for part in parts[1:])]
+    except ValueError:
+        return None
+
+
 class CuriosAgent:
     """Core agent with computer vision and automation capabilities"""
     
@@ -341,6 +471,7 @@ class CuriosAgent:
         # Initialize monitor manager
         from core.monitors import MonitorManager
         self.monitor_manager = MonitorManager()
+        self.select_monitor(config.get("monitor", 0))
         
         # Initialize AI providers
         self.providers = {}
@@ -349,6 +480,25 @@ class CuriosAgent:
         # Set current provider and model
         self.current_provider = config.get("ai_provider", "ollama")
         self.current_model = config.get("ai_model", "llava")
+        
+        # Persistent AI workers; the second lets a new instruction start
+        # while a stopped one's provider call is still finishing
+        self._ai_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-ai")
+        
+        # Screen pixels per screenshot pixel after downscaling for the model
+        self._coord_scale = (1.0, 1.0)
+        
+        # AI response hash -> action lines, most recently used last
+        self._parsed_action_cache: "OrderedDict[bytes, List[str]]" = OrderedDict()
+        
+        # Snapshot hot-path settings so actions don't hit the config per call
+        self.reload_tunables()
+    
+    def reload_tunables(self):
+        """Re-read cached config values used on the action hot path"""
+        self._mouse_speed = self.config.get("mouse_speed", 0.5)
+        self._typing_speed = self.config.get("typing_speed", 0.1)
+        self._privacy_on = self.config.get("screenshot_privacy", True)
     
     def _init_providers(self):
         """Initialize all available AI providers"""
@@ -425,37 +575,111 @@ class CuriosAgent:
         """Get list of available providers"""
         return list(self.providers.keys())
     
-    def take_screenshot(self) -> Optional[Image.Image]:
-        """Take screenshot with privacy filter"""
+    def select_monitor(self, monitor_id: int) -> bool:
+        """Select monitor and cache its region for capture"""
+        selected = self.monitor_manager.select_monitor(monitor_id)
+        self._monitor_region = self.monitor_manager.get_region()
+        return selected
+    
+    def _grab_frame(self) -> Optional[Image.Image]:
+        """Capture a raw frame of the selected monitor"""
+        try:
+            return pyautogui.screenshot(region=self._monitor_region)
+        except Exception as e:
+            logger.debug(f"Region capture failed, using full screen: {e}")
+            # Fallback to pyautogui
+            return pyautogui.screenshot()
+    
+    def _downscale_for_model(self, image: Image.Image) -> Tuple[Image.Image, Tuple[float, float]]:
+        """
+        Downscale screenshot to the current provider's input size
+        
+        Returns:
+            (image, scale) where scale is screen pixels per image pixel
+        """
+        provider = self.providers.get(self.current_provider)
+        target = provider.preferred_input_size() if provider else None
+        width, height = image.size
+        ratio = min(target[0] / width, target[1] / height) if target else 1.0
+        
+        if ratio >= 1.0:
+            return image, (1.0, 1.0)
+        
+        new_width = max(1, int(width * ratio))
+        new_height = max(1, int(height * ratio))
+        scale = (width / new_width, height / new_height)
+        return image.resize((new_width, new_height), Image.BOX), scale
+    
+    def _to_screen(self, x: int, y: int) -> Tuple[int, int]:
+        """Map screenshot coordinates from the AI back to screen pixels"""
+        sx, sy = self._coord_scale
+        return round(x * sx), round(y * sy)
+    
+    def _capture_for_model(self) -> Tuple[Optional[Image.Image], Tuple[float, float]]:
+        """Take a downscaled, privacy-filtered screenshot and its coordinate scale"""
         try:
-            # Use monitor manager if available
-            monitor_id = self.config.get("monitor", 0)
-            screenshot = self.monitor_manager.take_screenshot(monitor_id=monitor_id)
+            screenshot = self._grab_frame()
             
-            if not screenshot:
-                # Fallback to pyautogui
-                screenshot = pyautogui.screenshot()
+            # Shrink to the model's input size before any further processing
+            screenshot, scale = self._downscale_for_model(screenshot)
             
             # Apply privacy filter if enabled
-            if self.config.get("screenshot_privacy", True):
+            if self._privacy_on:
                 screenshot = PrivacyFilter.blur_sensitive_areas(screenshot)
             
-            return screenshot
+            return screenshot, scale
         except Exception as e:
             logger.error(f"Failed to take screenshot: {e}")
-            return None
+            return None, (1.0, 1.0)
+    
+    def take_screenshot(self) -> Optional[Image.Image]:
+        """Take screenshot with privacy filter"""
+        screenshot, self._coord_scale = self._capture_for_model()
+        return screenshot
     
     def analyze_screen(self, instruction: str) -> Optional[str]:
         """Analyze screen with Vision AI using fallback system"""
         return self.analyze_with_fallback(instruction)
     
+    def _analyze_in_background(self, instruction: str) -> Optional[str]:
+        """
+        Run the analysis on the AI pool, returning early if execution is
+        stopped
+        
+        Stopping does not abort the provider request: the abandoned call
+        runs to completion on its worker and its result, including the
+        coordinate scale, is discarded. The scale is only applied here, on
+        the executing thread, once the result is used.
+        """
+        future = self._ai_pool.submit(self._analyze, instruction)
+        while True:
+            try:
+                response, self._coord_scale = future.result(timeout=0.1)
+                return response
+            except FutureTimeoutError:
+                if not self.running:
+                    return None
+    
     def analyze_with_fallback(self, instruction: str) -> Optional[str]:
         """Analyze screen with automatic fallback between providers"""
-        screenshot = self.take_screenshot()
+        response, self._coord_scale = self._analyze(instruction)
+        return response
+    
+    def _analyze(self, instruction: str) -> Tuple[Optional[str], Tuple[float, float]]:
+        """
+        Capture the screen and query providers without touching agent state
+        
+        Returns:
+            (AI response or None, coordinate scale of the screenshot sent)
+        """
+        screenshot, scale = self._capture_for_model()
         if not screenshot:
             logger.error("Failed to take screenshot")
-            return None
-        
+            return None, scale
+        return self._query_providers(screenshot, instruction), scale
+    
+    def _query_providers(self, screenshot: Image.Image, instruction: str) -> Optional[str]:
+        """Ask the current provider, then the others in priority order"""
         # Try current provider first
         if self.current_provider in self.providers:
             provider = self.providers[self.current_provider]
@@ -500,17 +724,20 @@ class CuriosAgent:
             # Parse and execute action
             if action.startswith("move_mouse"):
                 # Extract coordinates
-                match = re.search(r'move_mouse\((\d+),\s*(\d+)\)', action)
-                if match:
-                    x, y = int(match.group(1)), int(match.group(2))
-                    duration = self.config.get("mouse_speed", 0.5)
+                args = _parse_call_args(action, "move_mouse", 2)
+                if args is None:
+                    match = _MOVE_MOUSE_RE.search(action)
+                    args = [int(match.group(1)), int(match.group(2))] if match else None
+                if args:
+                    x, y = self._to_screen(*args)
+                    duration = self._mouse_speed
                     pyautogui.moveTo(x, y, duration=duration)
                     logger.info(f"Moved mouse to ({x}, {y})")
                     return True
             
             elif action.startswith("click"):
                 # Extract button
-                match = re.search(r"click\(button=['\"](\w+)['\"]\)", action)
+                match = _CLICK_RE.search(action)
                 button = match.group(1) if match else 'left'
                 pyautogui.click(button=button)
                 logger.info(f"Clicked {button} button")
@@ -522,26 +749,32 @@ class CuriosAgent:
                 return True
             
             elif action.startswith("drag"):
-                match = re.search(r'drag\((\d+),\s*(\d+),\s*(\d+),\s*(\d+)\)', action)
-                if match:
-                    x1, y1 = int(match.group(1)), int(match.group(2))
-                    x2, y2 = int(match.group(3)), int(match.group(4))
-                    duration = self.config.get("mouse_speed", 0.5)
+                args = _parse_call_args(action, "drag", 4)
+                if args is None:
+                    match = _DRAG_RE.search(action)
+                    args = [int(g) for g in match.groups()] if match else None
+                if args:
+                    x1, y1 = self._to_screen(args[0], args[1])
+                    x2, y2 = self._to_screen(args[2], args[3])
+                    duration = self._mouse_speed
                     pyautogui.moveTo(x1, y1)
                     pyautogui.drag(x2 - x1, y2 - y1, duration=duration)
                     logger.info(f"Dragged from ({x1}, {y1}) to ({x2}, {y2})")
                     return True
             
             elif action.startswith("type_text"):
-                match = re.search(r'type_text\(["\'](.+?)["\']\)', action)
+                match = _TYPE_TEXT_RE.search(action)
                 if match:
                     text = match.group(1)
-                    interval = self.config.get("typing_speed", 0.1)
+                    interval = self._typing_speed
                     
                     # Use pydirectinput for games in FAIR_PLAY mode
                     if mode == OperationMode.FAIR_PLAY:
                         # Use pydirectinput.write for text input with human-like timing
                         pydirectinput.write(text, interval=interval)
+                    elif KEYWIN_AVAILABLE:
+                        # SendInput batch, no per-character sleep
+                        _kw_keyboard.write(text)
                     else:
                         pyautogui.write(text, interval=interval)
                     
@@ -549,7 +782,7 @@ class CuriosAgent:
                     return True
             
             elif action.startswith("press_key"):
-                match = re.search(r'press_key\(["\'](.+?)["\']\)', action)
+                match = _PRESS_KEY_RE.search(action)
                 if match:
                     key = match.group(1)
                     
@@ -562,7 +795,7 @@ class CuriosAgent:
                     return True
             
             elif action.startswith("hotkey"):
-                match = re.search(r'hotkey\(["\'](.+?)["\'],\s*["\'](.+?)["\']\)', action)
+                match = _HOTKEY_RE.search(action)
                 if match:
                     key1, key2 = match.group(1), match.group(2)
                     pyautogui.hotkey(key1, key2)
@@ -570,17 +803,23 @@ class CuriosAgent:
                     return True
             
             elif action.startswith("scroll"):
-                match = re.search(r'scroll\((-?\d+)\)', action)
-                if match:
-                    clicks = int(match.group(1))
+                args = _parse_call_args(action, "scroll", 1, cast=_parse_offset)
+                if args is None:
+                    match = _SCROLL_RE.search(action)
+                    args = [int(match.group(1))] if match else None
+                if args:
+                    clicks = args[0]
                     pyautogui.scroll(clicks)
                     logger.info(f"Scrolled {clicks} clicks")
                     return True
             
             elif action.startswith("wait"):
-                match = re.search(r'wait\((\d+(?:\.\d+)?)\)', action)
-                if match:
-                    seconds = float(match.group(1))
+                args = _parse_call_args(action, "wait", 1, cast=_parse_seconds)
+                if args is None:
+                    match = _WAIT_RE.search(action)
+                    args = [float(match.group(1))] if match else None
+                if args:
+                    seconds = args[0]
                     time.sleep(seconds)
                     logger.info(f"Waited {seconds} seconds")
                     return True
@@ -592,6 +831,32 @@ class CuriosAgent:
             logger.error(f"Failed to execute action: {e}")
             return False
     
+    @staticmethod
+    def _parse_actions(response: str) -> List[str]:
+        """Extract executable action lines from AI response"""
+        actions = []
+        for line in response.split('\n'):
+            # Only lines starting with an action verb can be executed;
+            # prose, comments and blank lines are skipped here
+            line = line.strip()
+            if line.startswith(ACTION_VERBS):
+                actions.append(line)
+        return actions
+    
+    def _get_actions(self, response: str) -> List[str]:
+        """Get action lines for response, reusing earlier parses"""
+        key = blake2b(response.encode('utf-8'), digest_size=16).digest()
+        actions = self._parsed_action_cache.get(key)
+        if actions is not None:
+            self._parsed_action_cache.move_to_end(key)
+            return actions
+        
+        actions = self._parse_actions(response)
+        self._parsed_action_cache[key] = actions
+        if len(self._parsed_action_cache) > PARSED_ACTION_CACHE_SIZE:
+            self._parsed_action_cache.popitem(last=False)
+        return actions
+    
     def execute_instruction(self, instruction: str, mode: OperationMode, 
                           confirm_callback=None) -> bool:
         """Execute user instruction"""
@@ -612,7 +877,10 @@ class CuriosAgent:
         # Analyze screen and get actions
         self.running = True
         try:
-            response = self.analyze_screen(instruction)
+            response = self._analyze_in_background(instruction)
+            if not self.running:
+                logger.info("Execution stopped by user")
+                return False
             if not response:
                 logger.error("Failed to analyze screen")
                 return False
@@ -620,25 +888,17 @@ class CuriosAgent:
             logger.info(f"AI Response: {response[:200]}...")
             
             # Extract and execute actions
-            lines = response.split('\n')
-            for line in lines:
+            for line in self._get_actions(response):
                 if not self.running:
                     logger.info("Execution stopped by user")
                     return False
                 
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('//'):
-                    # Check if line contains an action
-                    if any(action in line for action in [
-                        'move_mouse', 'click', 'double_click', 'drag',
-                        'type_text', 'press_key', 'hotkey', 'scroll', 'wait'
-                    ]):
-                        if mode == OperationMode.NORMAL and confirm_callback:
-                            if not confirm_callback(line):
-                                logger.info("User declined action")
-                                continue
-                        
-                        self.execute_action(line, mode)
+                if mode == OperationMode.NORMAL and confirm_callback:
+                    if not confirm_callback(line):
+                        logger.info("User declined action")
+                        continue
+                
+                self.execute_action(line, mode)
             
             logger.info("Instruction completed successfully")
             return True
@@ -649,18 +909,67 @@ class CuriosAgent:
         finally:
             self.running = False
     
+    async def execute_instruction_async(self, instruction: str, mode: OperationMode,
+                                        confirm_callback=None) -> bool:
+        """Execute user instruction without blocking the calling event loop"""
+        return await asyncio.to_thread(
+            self.execute_instruction, instruction, mode, confirm_callback
+        )
+    
     def stop(self):
         """Stop current execution"""
         self.running = False
         logger.info("Stopping execution...")
+    
+    def shutdown(self):
+        """Stop execution and release the AI workers (an in-flight provider call still finishes)"""
+        self.stop()
+        self._ai_pool.shutdown(wait=False, cancel_futures=True)
 
 # ============================================================================
 # GUI APPLICATION
 # ============================================================================
 
+# path -> (mtime, text) of documents shown by the legacy dialogs
+_DOCUMENT_TEXT: Dict[str, Tuple[float, str]] = {}
+
+
+def _load_document(path: str) -> str:
+    """Return the text of a bundled document, re-read only when it changes"""
+    try:
+        mtime = os.stat(path).st_mtime
+        cached = _DOCUMENT_TEXT.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        text = Path(path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        # Not cached, so a document added later is picked up
+        return f"{path} not found"
+    _DOCUMENT_TEXT[path] = (mtime, text)
+    return text
+
+
 class CuriosAgentGUI:
     """CustomTkinter GUI for Curios Agent"""
     
+    # Fixed attribute set: slot access from Tk callbacks skips the __dict__
+    # lookup. Widgets of lazily built tabs stay unset until first shown.
+    __slots__ = (
+        "config", "lang", "t", "agent", "template_manager", "root",
+        "_confirm_title", "_confirm_prefix",
+        "_confirm_dialog", "_confirm_label", "_confirm_answer", "_confirm_var",
+        "_confirm_pending",
+        "_models_by_provider", "_monitor_names", "_monitor_idx_by_name", "_mode_enum_cache",
+        "_loop", "_agent_executor", "_log_offset", "_log_io_executor", "_cfg_snapshot",
+        "tabview", "tab_control", "tab_settings", "tab_templates", "tab_logs", "tab_about",
+        "_i18n", "_tab_setup", "mode_var",
+        "prompt_text", "execute_btn", "stop_btn", "status_label",
+        "mode_dropdown", "monitor_dropdown", "ai_dropdown", "model_dropdown",
+        "lang_var", "_key_entries", "log_text",
+        "template_category_var", "templates_frame", "_template_rows",
+        "_font_title", "_font_row_name", "_font_row_desc",
+    )
+    
     def __init__(self):
         # Setup
         ctk.set_appearance_mode("dark")
@@ -670,6 +979,8 @@ class CuriosAgentGUI:
         self.config = ConfigManager()
         self.lang = Language(self.config.get("language", "en"))
         self.t = TRANSLATIONS[self.lang.value]
+        self._confirm_title = self.t["confirm_action"]
+        self._confirm_prefix = f"{self.t['confirm_message']}\n\n"
         
         # Check legal notice acceptance
         if not self.config.get("legal_notice_accepted", False):
@@ -680,6 +991,25 @@ class CuriosAgentGUI:
         # Create agent
         self.agent = CuriosAgent(self.config)
         
+        # Selectable models per provider (only Ollama exposes a choice)
+        from ai_providers.ollama_provider import OLLAMA_MODELS
+        self._models_by_provider = {"ollama": tuple(OLLAMA_MODELS.values())}
+        
+        # Monitor names are formatted once; index lookup avoids reparsing them
+        self._monitor_names = self.agent.monitor_manager.get_list() or ["Monitor 1"]
+        self._monitor_idx_by_name = {name: i for i, name in enumerate(self._monitor_names)}
+        
+        # Mode values resolve by dict lookup rather than OperationMode(...)
+        self._mode_enum_cache = {m.value: m for m in OperationMode}
+        
+        # One long-lived event loop runs agent work off the Tk thread; its
+        # default executor is a single persistent worker, so to_thread()
+        # reuses one thread instead of starting one per run
+        self._loop = asyncio.new_event_loop()
+        self._agent_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-exec")
+        self._loop.set_default_executor(self._agent_executor)
+        threading.Thread(target=self._loop.run_forever, daemon=True, name="agent-loop").start()
+        
         # Initialize template manager
         self.template_manager = TemplateManager() if TemplateManager else None
         
@@ -688,8 +1018,15 @@ class CuriosAgentGUI:
         self.root.title(self.t["app_title"])
         self.root.geometry("900x700")
         
-        # Create UI
+        # Bytes of LOG_FILE already shown in the logs tab; log file IO
+        # runs on its own worker so the Tk thread never blocks on disk
+        self._log_offset = 0
+        self._log_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-io")
+        
+        # Create UI (widgets read settings from one config snapshot)
+        self._cfg_snapshot = self.config.snapshot()
         self._create_ui()
+        self._build_confirm_dialog()
         
         # Status
         self.update_status(self.t["idle"])
@@ -699,9 +1036,12 @@ class CuriosAgentGUI:
     def _create_ui(self):
         """Create user interface"""
         # Create tabview
-        self.tabview = ctk.CTkTabview(self.root)
+        self.tabview = ctk.CTkTabview(self.root, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Translated widgets, re-labelled in place on language change
+        self._i18n = []
+        
         # Create tabs
         self.tab_control = self.tabview.add(self.t["control_panel"])
         self.tab_settings = self.tabview.add(self.t["settings"])
@@ -709,147 +1049,196 @@ class CuriosAgentGUI:
         self.tab_logs = self.tabview.add(self.t["logs"])
         self.tab_about = self.tabview.add(self.t["about"])
         
-        # Setup tabs
+        # Operation mode variable shared by the control dropdown and the
+        # settings radios, so both always show the same mode; both apply
+        # a selection through _on_mode_change
+        self.mode_var = ctk.StringVar(value=self._cfg_snapshot.get("mode", OperationMode.NORMAL.value))
+        
+        # Setup tabs: only the control panel is visible at startup, the
+        # rest are built the first time they are selected
+        self.log_text = None
+        self._tab_setup = {
+            self.t["settings"]: self._setup_settings_tab,
+            self.t["templates"]: self._setup_templates_tab,
+            self.t["logs"]: self._setup_logs_tab,
+            self.t["about"]: self._setup_about_tab,
+        }
         self._setup_control_tab()
-        self._setup_settings_tab()
-        self._setup_templates_tab()
-        self._setup_logs_tab()
-        self._setup_about_tab()
+    
+    def _L(self, widget, key: str, fmt: str = "{}"):
+        """Set a widget's translated text and remember it for language changes"""
+        widget.configure(text=fmt.format(self.t[key]))
+        self._i18n.append((widget, key, fmt))
+        return widget
+    
+    def _apply_language(self, lang: Language):
+        """Switch UI language by re-labelling existing widgets"""
+        old_t = self.t
+        self.lang = lang
+        self.t = t = TRANSLATIONS[lang.value]
+        self._confirm_title = t["confirm_action"]
+        self._confirm_prefix = f"{t['confirm_message']}\n\n"
+        self.root.title(t["app_title"])
+        
+        # Rename tabs and re-key the setup of tabs not built yet
+        for key in ("control_panel", "settings", "templates", "logs", "about"):
+            self.tabview.rename(old_t[key], t[key])
+            setup = self._tab_setup.pop(old_t[key], None)
+            if setup:
+                self._tab_setup[t[key]] = setup
+        
+        for widget, key, fmt in self._i18n:
+            widget.configure(text=fmt.format(t[key]))
+        
+        # Template rows carry localized names, so that list is redrawn
+        if getattr(self, "templates_frame", None) is not None:
+            self._load_templates_list()
+        
+        if not self.agent.running:
+            self.update_status(t["idle"])
+        logger.info(f"Language changed to: {lang.value}")
+    
+    def _on_tab_changed(self):
+        """Build the selected tab on first visit"""
+        self._ensure_tab(self.tabview.get())
+    
+    def _ensure_tab(self, name: str):
+        """Run the deferred setup for a tab if it has not been built yet"""
+        setup = self._tab_setup.pop(name, None)
+        if setup:
+            self._cfg_snapshot = self.config.snapshot()
+            setup()
     
     def _setup_control_tab(self):
         """Setup control panel tab"""
+        t = self.t
+        Label = ctk.CTkLabel
+        Button = ctk.CTkButton
+        Frame = ctk.CTkFrame
+        Menu = ctk.CTkOptionMenu
+        accent = COLORS["accent"]
+        accent_hover = COLORS["accent_hover"]
+        success = COLORS["success"]
+        error = COLORS["error"]
+        L = self._L
+        
         # Prompt input
-        ctk.CTkLabel(self.tab_control, text=self.t["prompt"],
-                    font=("Arial", 14)).pack(pady=(10, 5))
+        L(Label(self.tab_control, font=FONT_PROMPT), "prompt").pack(pady=(10, 5))
         
         self.prompt_text = ctk.CTkTextbox(self.tab_control, height=100)
         self.prompt_text.pack(fill="x", padx=10, pady=5)
         
         # Execute and Stop buttons
-        button_frame = ctk.CTkFrame(self.tab_control, fg_color="transparent")
+        button_frame = Frame(self.tab_control, fg_color="transparent")
         button_frame.pack(fill="x", padx=10, pady=10)
         
-        self.execute_btn = ctk.CTkButton(
-            button_frame, text=f"▶ {self.t['execute']}",
+        self.execute_btn = L(Button(
+            button_frame,
             command=self._on_execute,
-            font=("Arial", 14, "bold"),
+            font=FONT_BTN,
             height=40,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["accent_hover"]
-        )
+            fg_color=accent,
+            hover_color=accent_hover
+        ), "execute", "▶ {}")
         self.execute_btn.pack(side="left", expand=True, padx=5)
         
-        self.stop_btn = ctk.CTkButton(
-            button_frame, text=f"■ {self.t['stop']}",
+        self.stop_btn = L(Button(
+            button_frame,
             command=self._on_stop,
-            font=("Arial", 14, "bold"),
+            font=FONT_BTN,
             height=40,
-            fg_color=COLORS["error"],
+            fg_color=error,
             hover_color="#dc2626"
-        )
+        ), "stop", "■ {}")
         self.stop_btn.pack(side="left", expand=True, padx=5)
         self.stop_btn.configure(state="disabled")
         
         # Status
-        status_frame = ctk.CTkFrame(self.tab_control, fg_color="transparent")
+        status_frame = Frame(self.tab_control, fg_color="transparent")
         status_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(status_frame, text="●", 
-                    font=("Arial", 14),
-                    text_color=COLORS["success"]).pack(side="right", padx=5)
+        Label(status_frame, text="●", 
+             font=FONT_PROMPT,
+             text_color=success).pack(side="right", padx=5)
         
-        self.status_label = ctk.CTkLabel(status_frame, text=self.t["ready"],
-                                        font=("Arial", 12))
+        self.status_label = Label(status_frame, text=t["ready"],
+                                 font=FONT_TEXT)
         self.status_label.pack(side="right", padx=5)
         
         # Control dropdowns frame
-        controls_frame = ctk.CTkFrame(self.tab_control)
+        controls_frame = Frame(self.tab_control)
         controls_frame.pack(fill="x", padx=10, pady=10)
         
         # Mode dropdown
-        mode_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
+        mode_frame = Frame(controls_frame, fg_color="transparent")
         mode_frame.pack(side="left", padx=5, pady=5)
-        ctk.CTkLabel(mode_frame, text=self.t["mode"], 
-                    font=("Arial", 10)).pack()
-        self.mode_dropdown = ctk.CTkOptionMenu(
+        L(Label(mode_frame, font=FONT_SMALL), "mode").pack()
+        self.mode_dropdown = Menu(
             mode_frame,
             values=[OperationMode.NORMAL.value, OperationMode.FAIR_PLAY.value, OperationMode.CURIOS.value],
+            variable=self.mode_var,
             command=self._on_mode_change,
             width=120
         )
-        self.mode_dropdown.set(self.config.get("mode", OperationMode.NORMAL.value))
         self.mode_dropdown.pack()
         
         # Monitor dropdown
-        monitor_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
+        monitor_frame = Frame(controls_frame, fg_color="transparent")
         monitor_frame.pack(side="left", padx=5, pady=5)
-        ctk.CTkLabel(monitor_frame, text=self.t["monitor"], 
-                    font=("Arial", 10)).pack()
-        # Use get_list() for human-readable monitor names
-        monitor_names = self.agent.monitor_manager.get_list()
-        self.monitor_dropdown = ctk.CTkOptionMenu(
+        L(Label(monitor_frame, font=FONT_SMALL), "monitor").pack()
+        monitor_names = self._monitor_names
+        self.monitor_dropdown = Menu(
             monitor_frame,
-            values=monitor_names if monitor_names else ["Monitor 1"],
+            values=monitor_names,
             command=self._on_monitor_change,
             width=120
         )
         # Set current monitor selection (monitors are 0-indexed internally but shown as 1-indexed)
-        current_monitor_id = self.config.get("monitor", 0)
+        current_monitor_id = self._cfg_snapshot.get("monitor", 0)
         self.monitor_dropdown.set(monitor_names[current_monitor_id] if current_monitor_id < len(monitor_names) else monitor_names[0])
         self.monitor_dropdown.pack()
         
         # AI Provider dropdown
-        ai_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
+        ai_frame = Frame(controls_frame, fg_color="transparent")
         ai_frame.pack(side="left", padx=5, pady=5)
-        ctk.CTkLabel(ai_frame, text=self.t["ai_provider"], 
-                    font=("Arial", 10)).pack()
+        L(Label(ai_frame, font=FONT_SMALL), "ai_provider").pack()
         providers = self.agent.get_available_providers()
-        self.ai_dropdown = ctk.CTkOptionMenu(
+        self.ai_dropdown = Menu(
             ai_frame,
             values=providers if providers else ["ollama"],
             command=self._on_provider_change,
             width=120
         )
-        current_provider = self.config.get("ai_provider", "ollama")
+        current_provider = self._cfg_snapshot.get("ai_provider", "ollama")
         if current_provider in providers:
             self.ai_dropdown.set(current_provider)
         self.ai_dropdown.pack()
         
         # Model dropdown
-        model_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
+        model_frame = Frame(controls_frame, fg_color="transparent")
         model_frame.pack(side="left", padx=5, pady=5)
-        ctk.CTkLabel(model_frame, text=self.t["ai_model"], 
-                    font=("Arial", 10)).pack()
-        models = ["llava", "llama3", "dolphin-mixtral", "phi3"]
-        self.model_dropdown = ctk.CTkOptionMenu(
+        L(Label(model_frame, font=FONT_SMALL), "ai_model").pack()
+        self.model_dropdown = Menu(
             model_frame,
-            values=models,
+            values=list(self._models_by_provider["ollama"]),
             command=self._on_model_change,
             width=120
         )
-        self.model_dropdown.set(self.config.get("ai_model", "llava"))
+        self.model_dropdown.set(self._cfg_snapshot.get("ai_model", "llava"))
         self.model_dropdown.pack()
         
         # Quick actions
-        ctk.CTkLabel(self.tab_control, text=self.t["quick_actions"],
-                    font=("Arial", 12, "bold")).pack(pady=(10, 5), padx=10, anchor="w")
+        L(Label(self.tab_control, font=FONT_LBL), "quick_actions").pack(pady=(10, 5), padx=10, anchor="w")
         
-        quick_frame = ctk.CTkFrame(self.tab_control, fg_color="transparent")
+        quick_frame = Frame(self.tab_control, fg_color="transparent")
         quick_frame.pack(fill="x", padx=10, pady=5)
         
-        quick_actions = [
-            ("🌐 " + self.t["browser"], "Open web browser"),
-            ("📝 " + self.t["notepad"], "Open notepad"),
-            ("📁 " + self.t["explorer"], "Open file explorer"),
-            ("📷 " + self.t["screenshot"], "Take screenshot")
-        ]
-        
-        for text, action in quick_actions:
-            btn = ctk.CTkButton(
-                quick_frame, text=text,
-                command=lambda a=action: self._quick_action(a),
+        for icon, label_key, action in QUICK_ACTIONS:
+            btn = L(Button(
+                quick_frame,
+                command=partial(self._quick_action, action),
                 width=140, height=35
-            )
+            ), label_key, f"{icon} {{}}")
             btn.pack(side="left", padx=5)
     
     def _on_mode_change(self, mode: str):
@@ -865,21 +1254,30 @@ class CuriosAgentGUI:
     
     def _on_monitor_change(self, monitor: str):
         """Handle monitor change"""
-        # Extract monitor ID from "Monitor 1: Display (1920x1080)" format
-        try:
-            # Parse "Monitor X:" format
-            monitor_id = int(monitor.split(":")[0].split()[-1]) - 1  # Convert 1-indexed to 0-indexed
-            self.config.set("monitor", monitor_id)
-            self.agent.monitor_manager.select_monitor(monitor_id)
-            logger.info(f"Selected monitor: {monitor_id}")
-        except Exception as e:
-            logger.error(f"Failed to parse monitor selection: {e}")
+        monitor_id = self._monitor_idx_by_name.get(monitor)
+        if monitor_id is None:
+            logger.error(f"Unknown monitor selection: {monitor}")
+            return
+        
+        self.config.set("monitor", monitor_id)
+        self.agent.select_monitor(monitor_id)
+        logger.info(f"Selected monitor: {monitor_id}")
     
     def _on_provider_change(self, provider: str):
         """Handle AI provider change"""
         self.config.set("ai_provider", provider)
         self.agent.set_provider(provider)
         logger.info(f"Selected AI provider: {provider}")
+        
+        # Only providers with selectable models touch the model dropdown
+        models = self._models_by_provider.get(provider)
+        if not models:
+            return
+        self.model_dropdown.configure(values=list(models))
+        if self.model_dropdown.get() not in models:
+            # Keep agent and config in step with the dropdown
+            self.model_dropdown.set(models[0])
+            self._on_model_change(models[0])
     
     def _on_model_change(self, model: str):
         """Handle model change"""
@@ -895,96 +1293,89 @@ class CuriosAgentGUI:
     
     def _setup_settings_tab(self):
         """Setup settings tab"""
-        # Mode
-        ctk.CTkLabel(self.tab_settings, text=self.t["mode"],
-                    font=("Arial", 12, "bold")).pack(pady=10)
+        Label = ctk.CTkLabel
+        Button = ctk.CTkButton
+        Frame = ctk.CTkFrame
+        Radio = ctk.CTkRadioButton
+        Entry = ctk.CTkEntry
+        L = self._L
         
-        self.mode_var = ctk.StringVar(value=self.config.get("mode"))
+        # Mode
+        L(Label(self.tab_settings, font=FONT_LBL), "mode").pack(pady=10)
         
         modes = [
-            (OperationMode.NORMAL.value, self.t["normal_mode_desc"]),
-            (OperationMode.FAIR_PLAY.value, self.t["fair_play_mode_desc"]),
-            (OperationMode.CURIOS.value, self.t["curios_mode_desc"]),
+            (OperationMode.NORMAL.value, "normal_mode_desc"),
+            (OperationMode.FAIR_PLAY.value, "fair_play_mode_desc"),
+            (OperationMode.CURIOS.value, "curios_mode_desc"),
         ]
         
-        for mode_value, description in modes:
-            frame = ctk.CTkFrame(self.tab_settings)
-            frame.pack(fill="x", padx=10, pady=5)
-            
-            radio = ctk.CTkRadioButton(
-                frame, text=f"{mode_value}", 
+        # One grid for all mode rows instead of a frame per row
+        modes_frame = Frame(self.tab_settings)
+        modes_frame.pack(fill="x", padx=10, pady=5)
+        modes_frame.grid_columnconfigure(1, weight=1)
+        
+        for row, (mode_value, desc_key) in enumerate(modes):
+            radio = Radio(
+                modes_frame, text=f"{mode_value}", 
                 variable=self.mode_var,
-                value=mode_value
+                value=mode_value,
+                command=partial(self._on_mode_change, mode_value)
             )
-            radio.pack(side="left", padx=5)
+            radio.grid(row=row, column=0, sticky="w", padx=5, pady=5)
             
-            ctk.CTkLabel(frame, text=f"({description})",
-                        font=("Arial", 10)).pack(side="left", padx=5)
+            L(Label(modes_frame, font=FONT_SMALL), desc_key, "({})").grid(
+                row=row, column=1, sticky="w", padx=5, pady=5)
         
         # Language
-        ctk.CTkLabel(self.tab_settings, text=self.t["language"],
-                    font=("Arial", 12, "bold")).pack(pady=10)
+        L(Label(self.tab_settings, font=FONT_LBL), "language").pack(pady=10)
         
-        self.lang_var = ctk.StringVar(value=self.config.get("language"))
-        lang_frame = ctk.CTkFrame(self.tab_settings)
+        self.lang_var = ctk.StringVar(value=self._cfg_snapshot.get("language"))
+        lang_frame = Frame(self.tab_settings)
         lang_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkRadioButton(lang_frame, text="English", 
-                          variable=self.lang_var, value="en").pack(side="left", padx=10)
-        ctk.CTkRadioButton(lang_frame, text="Русский",
-                          variable=self.lang_var, value="ru").pack(side="left", padx=10)
+        Radio(lang_frame, text="English", 
+             variable=self.lang_var, value="en").pack(side="left", padx=10)
+        Radio(lang_frame, text="Русский",
+             variable=self.lang_var, value="ru").pack(side="left", padx=10)
         
         # API Keys section
-        ctk.CTkLabel(self.tab_settings, text="API Keys",
-                    font=("Arial", 12, "bold")).pack(pady=10)
-        
-        # Gemini API Key
-        api_keys = self.config.get("api_keys", {})
-        gemini_key = api_keys.get("gemini", "") or self.config.get("api_key", "")
-        
-        ctk.CTkLabel(self.tab_settings, text="Gemini API Key:",
-                    font=("Arial", 10)).pack(pady=(5, 2), padx=10, anchor="w")
-        self.gemini_key_entry = ctk.CTkEntry(self.tab_settings, width=400, show="*")
-        self.gemini_key_entry.pack(padx=10, pady=2)
-        self.gemini_key_entry.insert(0, gemini_key)
-        
-        # OpenAI API Key
-        ctk.CTkLabel(self.tab_settings, text="OpenAI API Key:",
-                    font=("Arial", 10)).pack(pady=(5, 2), padx=10, anchor="w")
-        self.openai_key_entry = ctk.CTkEntry(self.tab_settings, width=400, show="*")
-        self.openai_key_entry.pack(padx=10, pady=2)
-        self.openai_key_entry.insert(0, api_keys.get("openai", ""))
-        
-        # Claude API Key
-        ctk.CTkLabel(self.tab_settings, text="Claude API Key:",
-                    font=("Arial", 10)).pack(pady=(5, 2), padx=10, anchor="w")
-        self.claude_key_entry = ctk.CTkEntry(self.tab_settings, width=400, show="*")
-        self.claude_key_entry.pack(padx=10, pady=2)
-        self.claude_key_entry.insert(0, api_keys.get("claude", ""))
-        
-        # Ollama host
-        ctk.CTkLabel(self.tab_settings, text="Ollama Host:",
-                    font=("Arial", 10)).pack(pady=(5, 2), padx=10, anchor="w")
-        self.ollama_host_entry = ctk.CTkEntry(self.tab_settings, width=400)
-        self.ollama_host_entry.pack(padx=10, pady=2)
-        self.ollama_host_entry.insert(0, self.config.get("ollama_host", "http://localhost:11434"))
+        Label(self.tab_settings, text="API Keys",
+             font=FONT_LBL).pack(pady=10)
+        
+        cfg = self._cfg_snapshot
+        api_keys = cfg.get("api_keys", {})
+        values = {
+            "gemini": api_keys.get("gemini", "") or cfg.get("api_key", ""),
+            "openai": api_keys.get("openai", ""),
+            "claude": api_keys.get("claude", ""),
+            "ollama_host": cfg.get("ollama_host", "http://localhost:11434"),
+        }
+        
+        self._key_entries = {}
+        for label, key, show in SETTINGS_ENTRY_ROWS:
+            Label(self.tab_settings, text=label,
+                 font=FONT_SMALL).pack(pady=(5, 2), padx=10, anchor="w")
+            entry = Entry(self.tab_settings, width=400, show=show)
+            entry.pack(padx=10, pady=2)
+            entry.insert(0, values[key])
+            self._key_entries[key] = entry
         
         # Save button
-        ctk.CTkButton(
-            self.tab_settings, text=self.t["save_settings"],
+        L(Button(
+            self.tab_settings,
             command=self._on_save_settings,
-            font=("Arial", 14, "bold"),
+            font=FONT_BTN,
             height=40
-        ).pack(pady=20)
+        ), "save_settings").pack(pady=20)
     
     def _setup_logs_tab(self):
         """Setup logs tab"""
         # Clear button
-        ctk.CTkButton(
-            self.tab_logs, text=self.t["clear_logs"],
+        self._L(ctk.CTkButton(
+            self.tab_logs,
             command=self._on_clear_logs,
             height=30
-        ).pack(pady=5)
+        ), "clear_logs").pack(pady=5)
         
         # Log display
         self.log_text = ctk.CTkTextbox(self.tab_logs)
@@ -995,11 +1386,11 @@ class CuriosAgentGUI:
     
     def _setup_about_tab(self):
         """Setup about tab"""
-        ctk.CTkLabel(
-            self.tab_about, text=self.t["about_text"],
-            font=("Arial", 12),
+        self._L(ctk.CTkLabel(
+            self.tab_about,
+            font=FONT_TEXT,
             justify="left"
-        ).pack(pady=20, padx=20)
+        ), "about_text").pack(pady=20, padx=20)
     
     def _on_execute(self):
         """Handle execute button"""
@@ -1012,26 +1403,26 @@ class CuriosAgentGUI:
             self._show_error(self.t["api_key_required"])
             return
         
-        # Get mode from dropdown
-        mode = OperationMode(self.mode_dropdown.get())
+        # Get mode from dropdown (shared with the settings radios)
+        mode = self._mode_enum_cache[self.mode_var.get()]
+        if mode != OperationMode.NORMAL and not self.config.get("eula_accepted", False):
+            self._show_error(self.t["eula_required"])
+            return
         
         # Update UI
         self.execute_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.update_status(self.t["executing"])
         
-        # Execute in thread
-        def execute_thread():
-            try:
-                self.agent.execute_instruction(
-                    instruction, mode,
-                    confirm_callback=self._confirm_action
-                )
-            finally:
-                self.root.after(0, self._execution_finished)
-        
-        thread = threading.Thread(target=execute_thread, daemon=True)
-        thread.start()
+        # Execute on the background event loop
+        future = asyncio.run_coroutine_threadsafe(
+            self.agent.execute_instruction_async(
+                instruction, mode,
+                confirm_callback=self._confirm_action
+            ),
+            self._loop
+        )
+        future.add_done_callback(lambda _f: self.root.after_idle(self._execution_finished))
     
     def _on_stop(self):
         """Handle stop button"""
@@ -1043,6 +1434,7 @@ class CuriosAgentGUI:
         self.execute_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.update_status(self.t["idle"])
+        self._ensure_tab(self.t["logs"])
         self._load_logs()
     
     def _on_save_settings(self):
@@ -1053,8 +1445,10 @@ class CuriosAgentGUI:
             # Check if EULA has been accepted
             if not self.config.get("eula_accepted", False):
                 if not self._show_eula():
-                    # User declined EULA, revert mode to current
-                    self.mode_var.set(self.config.get("mode"))
+                    # User declined EULA, revert to the last saved mode
+                    saved_mode = self._cfg_snapshot.get("mode", OperationMode.NORMAL.value)
+                    self.mode_var.set(saved_mode)
+                    self._on_mode_change(saved_mode)
                     self._show_error(self.t["eula_required"])
                     return
         
@@ -1062,63 +1456,189 @@ class CuriosAgentGUI:
         self.config.set("language", self.lang_var.get())
         
         # Save API keys
-        api_keys = {
-            "gemini": self.gemini_key_entry.get(),
-            "openai": self.openai_key_entry.get(),
-            "claude": self.claude_key_entry.get()
-        }
+        entries = self._key_entries
+        api_keys = {name: entries[name].get() for name in ("gemini", "openai", "claude")}
         self.config.set("api_keys", api_keys)
-        self.config.set("ollama_host", self.ollama_host_entry.get())
+        self.config.set("ollama_host", entries["ollama_host"].get())
         
         if self.config.save():
+            self._cfg_snapshot = self.config.snapshot()
+            
             # Reinitialize agent with new settings
             self.agent._init_providers()
+            self.agent.reload_tunables()
             
-            # Update language
+            # Update language in place
             if self.lang_var.get() != self.lang.value:
-                self._show_info(self.t["settings_saved"])
-                # Would need to restart for full language change
-            else:
-                self._show_info(self.t["settings_saved"])
+                self._apply_language(Language(self.lang_var.get()))
+            self._show_info(self.t["settings_saved"])
         
         self._load_logs()
     
     def _on_clear_logs(self):
         """Clear logs"""
+        future = self._log_io_executor.submit(self._truncate_logs)
+        future.add_done_callback(
+            lambda f: f.result() and self.root.after_idle(self.log_text.delete, "1.0", "end")
+        )
+    
+    def _truncate_logs(self) -> bool:
+        """Truncate log file (runs on the log IO worker)"""
         try:
-            open(LOG_FILE, 'w').close()
-            self.log_text.delete("1.0", "end")
+            try:
+                os.truncate(LOG_FILE, 0)
+            except FileNotFoundError:
+                open(LOG_FILE, 'a').close()
+            self._log_offset = 0
             logger.info("Logs cleared")
+            return True
         except Exception as e:
             logger.error(f"Failed to clear logs: {e}")
+            return False
     
     def _load_logs(self):
-        """Load logs into display"""
+        """Append new log lines to display"""
+        # Logs tab not built yet; it loads everything when first shown
+        if self.log_text is None:
+            return
+        
+        future = self._log_io_executor.submit(self._read_new_logs)
+        future.add_done_callback(lambda f: self.root.after_idle(self._apply_logs, *f.result()))
+    
+    def _read_new_logs(self) -> Tuple[bool, str]:
+        """
+        Read complete log lines written since the last load
+        (runs on the log IO worker)
+        
+        Returns:
+            Tuple of (reset: bool, text: str); reset means the display
+            must be cleared first because the file shrank
+        """
         try:
-            if os.path.exists(LOG_FILE):
-                with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                    logs = f.read()
-                    self.log_text.delete("1.0", "end")
-                    self.log_text.insert("1.0", logs)
+            if not os.path.exists(LOG_FILE):
+                return False, ""
+            
+            # File shrank (cleared or rotated): reload from the start
+            reset = os.path.getsize(LOG_FILE) < self._log_offset
+            if reset:
+                self._log_offset = 0
+            
+            with open(LOG_FILE, 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read()
+            
+            # Only consume complete lines; a partial one is picked up next time
+            end = data.rfind(b'\n') + 1
+            self._log_offset += end
+            return reset, data[:end].decode('utf-8', errors='replace')
         except Exception as e:
             logger.error(f"Failed to load logs: {e}")
+            return False, ""
+    
+    def _apply_logs(self, reset: bool, text: str):
+        """Apply log update on the Tk thread"""
+        if reset:
+            self.log_text.delete("1.0", "end")
+        if text:
+            self.log_text.insert("end", text)
+            self.log_text.delete("1.0", f"end-{LOG_VIEW_MAX_LINES}l")
+    
+    def _build_confirm_dialog(self):
+        """Build the hidden confirmation window reused for every action"""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.withdraw()
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.protocol("WM_DELETE_WINDOW", partial(self._close_confirm, False))
+        
+        self._confirm_label = ctk.CTkLabel(
+            dialog,
+            font=FONT_TEXT,
+            wraplength=400,
+            justify="left"
+        )
+        self._confirm_label.pack(padx=20, pady=(20, 10))
+        
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(pady=(0, 20))
+        
+        self._L(ctk.CTkButton(
+            button_frame,
+            command=partial(self._close_confirm, True),
+            fg_color=COLORS["success"],
+            width=120
+        ), "yes").pack(side="left", padx=10)
+        
+        self._L(ctk.CTkButton(
+            button_frame,
+            command=partial(self._close_confirm, False),
+            fg_color=COLORS["error"],
+            width=120
+        ), "no").pack(side="left", padx=10)
+        
+        self._confirm_dialog = dialog
+        self._confirm_answer = False
+        self._confirm_pending = False
+        self._confirm_var = tk.BooleanVar(self.root, value=False)
+    
+    def _close_confirm(self, answer: bool):
+        """Record the answer; writing the variable ends the dialog wait"""
+        self._confirm_answer = answer
+        self._confirm_var.set(answer)
+    
+    def _ask_confirm(self, message: str) -> bool:
+        """Show the confirmation window and wait for an answer (Tk thread only)"""
+        # The window is shared: never nest a second wait on the same variable
+        if self._confirm_pending:
+            logger.warning("Confirmation already pending, declining action")
+            return False
+        
+        dialog = self._confirm_dialog
+        self._confirm_answer = False
+        self._confirm_pending = True
+        dialog.title(self._confirm_title)
+        self._confirm_label.configure(text=message)
+        dialog.deiconify()
+        dialog.lift()
+        try:
+            # X11 refuses a grab on a window that is not mapped yet
+            dialog.wait_visibility()
+            dialog.grab_set()
+        except tk.TclError as e:
+            logger.debug(f"Confirm dialog grab failed: {e}")
+        try:
+            dialog.wait_variable(self._confirm_var)
+        finally:
+            self._confirm_pending = False
+            dialog.grab_release()
+            dialog.withdraw()
+        return self._confirm_answer
     
     def _confirm_action(self, action: str) -> bool:
         """Confirmation dialog for actions in NORMAL mode with threading fix"""
+        # Already on the Tk thread: ask directly, no scheduler round-trip
+        if threading.current_thread() is threading.main_thread():
+            return self._ask_confirm(self._confirm_prefix + action)
+        
         result = [None]
         event = threading.Event()
         
         def show_dialog():
-            result[0] = messagebox.askyesno(
-                self.t["confirm_action"],
-                f"{self.t['confirm_message']}\n\n{action}"
-            )
-            event.set()
-        
-        self.root.after(0, show_dialog)
-        # Wait with timeout to prevent deadlock
-        event.wait(timeout=30)
-        return result[0] if result[0] is not None else False
+            try:
+                result[0] = self._ask_confirm(self._confirm_prefix + action)
+            except Exception as e:
+                logger.error(f"Confirmation dialog failed: {e}")
+            finally:
+                # Always release the worker; a missing result declines
+                event.set()
+        
+        self.root.after_idle(show_dialog)
+        # Wait with timeout to prevent deadlock; on timeout the action is
+        # declined and the window is closed so it does not linger grabbed
+        if not event.wait(timeout=30):
+            self.root.after_idle(self._close_confirm, False)
+            return False
+        return bool(result[0])
     
     def _show_error(self, message: str):
         """Show error message"""
@@ -1134,146 +1654,86 @@ class CuriosAgentGUI:
     
     def _show_legal_notice(self) -> bool:
         """Show legal notice dialog and get acceptance"""
-        # Use new LegalDialog if UI modules are available
-        if UI_AVAILABLE and LegalDialog:
-            try:
-                dialog = LegalDialog(parent=None, translations=self.t)
-                accepted = dialog.show()
-                if accepted:
-                    self.config.set("legal_notice_accepted", True)
-                    self.config.save()
-                return accepted
-            except Exception as e:
-                logger.error(f"Failed to show LegalDialog: {e}")
-                # Fall through to legacy dialog
-        
-        # Legacy dialog (fallback)
-        dialog = ctk.CTkToplevel(None)
-        dialog.title(self.t["legal_notice_title"])
-        dialog.geometry("800x600")
-        dialog.grab_set()
-        
-        accepted = [False]  # Use list to modify in nested function
-        
-        # Read legal notice
-        legal_text = ""
-        try:
-            with open("LEGAL_NOTICE.md", "r", encoding="utf-8") as f:
-                legal_text = f.read()
-        except:
-            legal_text = "LEGAL_NOTICE.md not found"
-        
-        # Text widget
-        text_widget = ctk.CTkTextbox(dialog, width=750, height=480)
-        text_widget.pack(padx=20, pady=20)
-        text_widget.insert("1.0", legal_text)
-        text_widget.configure(state="disabled")
-        
-        # Button frame
-        button_frame = ctk.CTkFrame(dialog)
-        button_frame.pack(pady=10)
-        
-        def on_accept():
-            accepted[0] = True
-            self.config.set("legal_notice_accepted", True)
-            self.config.save()
-            dialog.destroy()
-        
-        def on_decline():
-            accepted[0] = False
-            dialog.destroy()
-        
-        ctk.CTkButton(
-            button_frame,
-            text=self.t["legal_notice_accept"],
-            command=on_accept,
-            width=200,
-            height=40,
-            fg_color=COLORS["success"] if not UI_AVAILABLE else Theme.BTN_PRIMARY_BG
-        ).pack(side="left", padx=10)
-        
-        ctk.CTkButton(
-            button_frame,
-            text=self.t["legal_notice_decline"],
-            command=on_decline,
-            width=200,
-            height=40,
-            fg_color=COLORS["error"] if not UI_AVAILABLE else Theme.BTN_DANGER_BG
-        ).pack(side="left", padx=10)
-        
-        # Wait for dialog to close
-        dialog.wait_window()
-        
-        return accepted[0]
+        return self._ensure_accepted(
+            "legal_notice_accepted", "LEGAL_NOTICE.md",
+            "legal_notice_title", "legal_notice_accept", "legal_notice_decline",
+            LegalDialog if UI_AVAILABLE else None, parent=None
+        )
     
     def _show_eula(self) -> bool:
         """Show EULA dialog and get acceptance"""
-        # Use new EULADialog if UI modules are available
-        if UI_AVAILABLE and EULADialog:
+        return self._ensure_accepted(
+            "eula_accepted", "EULA.md",
+            "eula_title", "eula_accept", "eula_decline",
+            EULADialog if UI_AVAILABLE else None, parent=self.root
+        )
+    
+    def _ensure_accepted(self, key: str, file: str, title_key: str, accept_key: str,
+                         decline_key: str, dialog_class=None, parent=None) -> bool:
+        """
+        Return True if a document is accepted, asking the user only if needed
+        
+        Args:
+            key: Config flag recording acceptance
+            file: Document shown by the legacy dialog
+            title_key, accept_key, decline_key: Translation keys for the legacy dialog
+            dialog_class: ui.dialogs class to try first (LegalDialog/EULADialog)
+            parent: Parent window, None before the main window exists
+        """
+        # Already accepted: no widgets are created at all
+        if self.config.get(key, False):
+            return True
+        
+        # Use new dialog if UI modules are available
+        if dialog_class:
             try:
-                dialog = EULADialog(parent=self.root, translations=self.t)
-                accepted = dialog.show()
+                accepted = dialog_class(parent=parent, translations=self.t).show()
                 if accepted:
-                    self.config.set("eula_accepted", True)
+                    self.config.set(key, True)
                     self.config.save()
                 return accepted
             except Exception as e:
-                logger.error(f"Failed to show EULADialog: {e}")
+                logger.error(f"Failed to show {dialog_class.__name__}: {e}")
                 # Fall through to legacy dialog
         
         # Legacy dialog (fallback)
-        dialog = ctk.CTkToplevel(self.root)
-        dialog.title(self.t["eula_title"])
+        dialog = ctk.CTkToplevel(parent)
+        dialog.title(self.t[title_key])
         dialog.geometry("800x600")
         dialog.grab_set()
         
         accepted = [False]  # Use list to modify in nested function
         
-        # Read EULA
-        eula_text = ""
-        try:
-            with open("EULA.md", "r", encoding="utf-8") as f:
-                eula_text = f.read()
-        except:
-            eula_text = "EULA.md not found"
-        
         # Text widget
         text_widget = ctk.CTkTextbox(dialog, width=750, height=480)
         text_widget.pack(padx=20, pady=20)
-        text_widget.insert("1.0", eula_text)
+        text_widget.insert("1.0", _load_document(file))
         text_widget.configure(state="disabled")
         
         # Button frame
         button_frame = ctk.CTkFrame(dialog)
         button_frame.pack(pady=10)
         
-        def on_accept():
-            accepted[0] = True
-            self.config.set("eula_accepted", True)
-            self.config.save()
+        def close(answer: bool):
+            accepted[0] = answer
+            if answer:
+                self.config.set(key, True)
+                self.config.save()
             dialog.destroy()
         
-        def on_decline():
-            accepted[0] = False
-            dialog.destroy()
-        
-        ctk.CTkButton(
-            button_frame,
-            text=self.t["eula_accept"],
-            command=on_accept,
-            width=200,
-            height=40,
-            fg_color=COLORS["success"] if not UI_AVAILABLE else Theme.BTN_PRIMARY_BG
-        ).pack(side="left", padx=10)
-        
-        ctk.CTkButton(
-            button_frame,
-            text=self.t["eula_decline"],
-            command=on_decline,
-            width=200,
-            height=40,
-            fg_color=COLORS["error"] if not UI_AVAILABLE else Theme.BTN_DANGER_BG
-        ).pack(side="left", padx=10)
+        buttons = (
+            (accept_key, True, COLORS["success"] if not UI_AVAILABLE else Theme.BTN_PRIMARY_BG),
+            (decline_key, False, COLORS["error"] if not UI_AVAILABLE else Theme.BTN_DANGER_BG),
+        )
+        for text_key, answer, color in buttons:
+            ctk.CTkButton(
+                button_frame,
+                text=self.t[text_key],
+                command=partial(close, answer),
+                width=200,
+                height=40,
+                fg_color=color
+            ).pack(side="left", padx=10)
         
         # Wait for dialog to close
         dialog.wait_window()
@@ -1286,28 +1746,31 @@ class CuriosAgentGUI:
             ctk.CTkLabel(
                 self.tab_templates,
                 text="Templates module not available",
-                font=("Arial", 14)
+                font=FONT_PROMPT
             ).pack(pady=20)
             return
         
+        # Font objects shared by the title and every template row
+        self._font_title = ctk.CTkFont(family=FONT_BTN[0], size=FONT_BTN[1], weight="bold")
+        self._font_row_name = ctk.CTkFont(family=FONT_LBL[0], size=FONT_LBL[1], weight="bold")
+        self._font_row_desc = ctk.CTkFont(family=FONT_SMALL[0], size=FONT_SMALL[1])
+        
         # Title
-        ctk.CTkLabel(
+        self._L(ctk.CTkLabel(
             self.tab_templates,
-            text=self.t["select_template"],
-            font=("Arial", 14, "bold")
-        ).pack(pady=10)
+            font=self._font_title
+        ), "select_template").pack(pady=10)
         
         # Category filter
         category_frame = ctk.CTkFrame(self.tab_templates)
         category_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(
+        self._L(ctk.CTkLabel(
             category_frame,
-            text=self.t["template_category"],
-            font=("Arial", 12)
-        ).pack(side="left", padx=5)
+            font=FONT_TEXT
+        ), "template_category").pack(side="left", padx=5)
         
-        categories = ["all"] + self.template_manager.get_categories()
+        categories = ["all", *self.template_manager.get_categories()]
         self.template_category_var = ctk.StringVar(value="all")
         
         category_menu = ctk.CTkOptionMenu(
@@ -1321,6 +1784,7 @@ class CuriosAgentGUI:
         # Templates list
         self.templates_frame = ctk.CTkScrollableFrame(self.tab_templates, height=400)
         self.templates_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self._template_rows = []
         
         # Load templates
         self._load_templates_list()
@@ -1331,10 +1795,6 @@ class CuriosAgentGUI:
     
     def _load_templates_list(self):
         """Load and display templates list"""
-        # Clear existing
-        for widget in self.templates_frame.winfo_children():
-            widget.destroy()
-        
         # Get filtered templates
         category = self.template_category_var.get()
         if category == "all":
@@ -1342,38 +1802,49 @@ class CuriosAgentGUI:
         else:
             templates = self.template_manager.get_templates_by_category(category)
         
-        # Display templates
-        for template in templates:
-            frame = ctk.CTkFrame(self.templates_frame)
-            frame.pack(fill="x", padx=5, pady=5)
+        # Display templates, reusing row widgets from earlier renders
+        rows = self._template_rows
+        get_localized = self.template_manager.get_localized
+        lang = self.lang.value
+        for i, template in enumerate(templates):
+            if i == len(rows):
+                rows.append(self._create_template_row())
+            frame, name_label, desc_label, run_btn = rows[i]
             
             # Get localized name and description
-            name_key = f"name_{self.lang.value}"
-            desc_key = f"description_{self.lang.value}"
-            name = template.get(name_key, template.get("name", "Unknown"))
-            description = template.get(desc_key, template.get("description_en", ""))
+            name, description = get_localized(template, lang)
             
-            # Name label
-            ctk.CTkLabel(
-                frame,
-                text=name,
-                font=("Arial", 12, "bold")
-            ).pack(side="left", padx=5)
-            
-            # Description label
-            ctk.CTkLabel(
-                frame,
-                text=description,
-                font=("Arial", 10)
-            ).pack(side="left", padx=5)
-            
-            # Run button
-            ctk.CTkButton(
-                frame,
+            name_label.configure(text=name)
+            desc_label.configure(text=description)
+            run_btn.configure(
                 text=self.t["run_template"],
-                command=lambda t=template: self._run_template(t),
-                width=120
-            ).pack(side="right", padx=5)
+                command=partial(self._run_template, template)
+            )
+            if not frame.winfo_manager():
+                frame.pack(fill="x", padx=5, pady=5)
+        
+        # Hide rows left over from a longer list (always a trailing run,
+        # so re-packing them later keeps the display order)
+        for frame, _, _, _ in rows[len(templates):]:
+            frame.pack_forget()
+    
+    def _create_template_row(self) -> Tuple:
+        """Create one reusable templates-list row: frame, labels and run button"""
+        frame = ctk.CTkFrame(self.templates_frame)
+        
+        # Name label
+        name_label = ctk.CTkLabel(frame, font=self._font_row_name)
+        name_label.pack(side="left", padx=5)
+        
+        # Description label
+        desc_label = ctk.CTkLabel(frame, font=self._font_row_desc)
+        desc_label.pack(side="left", padx=5)
+        
+        # Run button
+        run_btn = ctk.CTkButton(frame, width=120)
+        run_btn.pack(side="right", padx=5)
+        
+        return frame, name_label, desc_label, run_btn
     
     def _run_template(self, template: Dict):
         """Run a template"""
@@ -1392,7 +1863,15 @@ class CuriosAgentGUI:
     
     def run(self):
         """Run the application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # The agent-exec worker is not a daemon thread: stop any running
+            # instruction so it returns and the interpreter can exit
+            self.agent.shutdown()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._agent_executor.shutdown(wait=False, cancel_futures=True)
+            self._log_io_executor.shutdown(wait=False, cancel_futures=True)
 
 # ============================================================================
 # MAIN
@@ -1402,6 +1881,7 @@ def main():
     """Main entry point"""
     logger.info(f"Starting {APP_NAME} v{VERSION}")
     logger.info(f"Platform: {platform.platform()}")
+    logger.info(f"Action regex engine: {'re2' if RE2_AVAILABLE else 're'}")
     
     # Use improved VM detection
     vm_detected, vm_reason = detect_vm()
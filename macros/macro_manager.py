@@ -6,13 +6,72 @@ Macro Manager - Record, save, and playback action macros
 
 import os
 import json
+import stat
 import logging
+import tempfile
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson (C extension) for the macro (de)serialization paths
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _default_file_mode() -> int:
+    """Permissions open() would give a new file under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask can only be queried by setting it
+_FILE_MODE = _default_file_mode()
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file in one call via a temp file + rename, so it is never half-written"""
+    # mkstemp creates 0600 files; keep the target's mode (or the usual
+    # default for new files) so the rename does not tighten permissions
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = _FILE_MODE
+    
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _json_loads(data) -> Any:
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class MacroManager:
     """Manages action macros"""
@@ -22,14 +81,99 @@ class MacroManager:
         self.macros_dir.mkdir(exist_ok=True)
         
         self.recording = False
-        self.current_macro = []
+        self.current_macro = deque()
         self.current_macro_name = None
+        self._append = self.current_macro.append
+        self._debug_enabled = False
+        
+        # Macro metadata index ({stem: {"mtime", "info"}}), so listing macros
+        # only parses files that changed since they were last indexed; the
+        # name has no .json suffix so no macro file can collide with it
+        self._index_path = self.macros_dir / ".macro_index"
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._load_index()
+        self._refresh_index()
+    
+    @staticmethod
+    def _macro_info(macro_data: Dict[str, Any], default_name: str) -> Dict[str, Any]:
+        """Extract the listing fields of a macro"""
+        return {
+            "name": macro_data.get("name", default_name),
+            "description": macro_data.get("description", ""),
+            "created_at": macro_data.get("created_at", ""),
+            "action_count": len(macro_data.get("actions", []))
+        }
+    
+    def _load_index(self):
+        """Load the saved macro index; a missing or bad index starts empty"""
+        try:
+            with open(self._index_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Macro index unreadable, rebuilding: {e}")
+            return
+        
+        if not isinstance(data, dict):
+            logger.warning("Macro index is not a JSON object, rebuilding")
+            return
+        # Malformed entries are dropped and re-read from their macro files
+        self._index = {
+            stem: entry for stem, entry in data.items()
+            if isinstance(entry, dict) and isinstance(entry.get("info"), dict)
+            and isinstance(entry.get("mtime"), (int, float))
+        }
+    
+    def _refresh_index(self):
+        """Re-read macro files whose mtime changed since indexing and drop deleted ones"""
+        index = self._index
+        seen = set()
+        changed = False
+        
+        with os.scandir(self.macros_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json') or not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                stem = entry.name[:-5]
+                seen.add(stem)
+                mtime = entry.stat().st_mtime
+                cached = index.get(stem)
+                if cached is not None and cached.get("mtime") == mtime:
+                    continue
+                
+                try:
+                    with open(entry.path, 'rb') as f:
+                        macro_data = _json_loads(f.read())
+                    index[stem] = {"mtime": mtime, "info": self._macro_info(macro_data, stem)}
+                    changed = True
+                except Exception as e:
+                    logger.error(f"Failed to load macro info from {entry.path}: {e}")
+        
+        for stem in index.keys() - seen:
+            del index[stem]
+            changed = True
+        
+        if changed:
+            self._save_index()
+    
+    def _save_index(self):
+        """Write the macro index to disk"""
+        try:
+            _atomic_write(self._index_path, _json_dumps(self._index, indent=False))
+        except Exception as e:
+            logger.error(f"Failed to save macro index: {e}")
     
     def start_recording(self, macro_name: str):
         """Start recording a macro"""
         self.recording = True
-        self.current_macro = []
+        self.current_macro = deque()
         self.current_macro_name = macro_name
+        # Bound once so each recorded action skips the attribute lookups
+        self._append = self.current_macro.append
+        # Level checked once per recording, not once per recorded action
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
         logger.info(f"Started recording macro: {macro_name}")
     
     def stop_recording(self) -> Optional[List[str]]:
@@ -39,14 +183,17 @@ class MacroManager:
             return None
         
         self.recording = False
-        logger.info(f"Stopped recording macro: {self.current_macro_name} ({len(self.current_macro)} actions)")
-        return self.current_macro.copy()
+        actions, self.current_macro = list(self.current_macro), deque()
+        self._append = self.current_macro.append
+        logger.info(f"Stopped recording macro: {self.current_macro_name} ({len(actions)} actions)")
+        return actions
     
     def record_action(self, action: str):
         """Record an action to current macro"""
         if self.recording:
-            self.current_macro.append(action)
-            logger.debug(f"Recorded action: {action}")
+            self._append(action)
+            if self._debug_enabled:
+                logger.debug("Recorded action: %s", action)
     
     def is_recording(self) -> bool:
         """Check if currently recording"""
@@ -75,8 +222,13 @@ class MacroManager:
             
             file_path = self.macros_dir / f"{macro_name}.json"
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(macro_data, f, indent=2, ensure_ascii=False)
+            _atomic_write(file_path, _json_dumps(macro_data))
+            
+            self._index[macro_name] = {
+                "mtime": file_path.stat().st_mtime,
+                "info": self._macro_info(macro_data, macro_name)
+            }
+            self._save_index()
             
             logger.info(f"Saved macro: {macro_name} ({len(actions)} actions)")
             return True
@@ -102,8 +254,8 @@ class MacroManager:
                 logger.error(f"Macro not found: {macro_name}")
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                macro_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                macro_data = _json_loads(f.read())
             
             logger.info(f"Loaded macro: {macro_name}")
             return macro_data
@@ -119,6 +271,8 @@ class MacroManager:
             
             if file_path.exists():
                 file_path.unlink()
+                if self._index.pop(macro_name, None) is not None:
+                    self._save_index()
                 logger.info(f"Deleted macro: {macro_name}")
                 return True
             else:
@@ -136,28 +290,13 @@ class MacroManager:
         Returns:
             List of macro info dictionaries
         """
-        macros = []
-        
         try:
-            for file_path in self.macros_dir.glob("*.json"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        macro_data = json.load(f)
-                    
-                    macros.append({
-                        "name": macro_data.get("name", file_path.stem),
-                        "description": macro_data.get("description", ""),
-                        "created_at": macro_data.get("created_at", ""),
-                        "action_count": len(macro_data.get("actions", []))
-                    })
-                except Exception as e:
-                    logger.error(f"Failed to load macro info from {file_path}: {e}")
-            
-            logger.info(f"Found {len(macros)} macros")
-            
+            self._refresh_index()
         except Exception as e:
             logger.error(f"Failed to list macros: {e}")
         
+        macros = [entry["info"] for entry in self._index.values()]
+        logger.info(f"Found {len(macros)} macros")
         return macros
     
     def get_macro_actions(self, macro_name: str) -> Optional[List[str]]:
@@ -190,7 +329,7 @@ class MacroManager:
         macro_data = self.load_macro(macro_name)
         
         if macro_data:
-            return json.dumps(macro_data, indent=2, ensure_ascii=False)
+            return _json_dumps(macro_data).decode('utf-8')
         
         return None
     
@@ -205,7 +344,7 @@ class MacroManager:
             Macro name if imported successfully, None otherwise
         """
         try:
-            macro_data = json.loads(json_string)
+            macro_data = _json_loads(json_string)
             
             macro_name = macro_data.get("name")
             if not macro_name:
@@ -9,8 +9,10 @@ import sys
 import importlib
 import importlib.util
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from plugins.base_plugin import BasePlugin
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,13 @@ class PluginManager:
         self.plugins_dir = Path(plugins_dir)
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_modules: Dict[str, Any] = {}
+        # Guards the registries above while plugins load in parallel
+        self._plugins_lock = threading.Lock()
+        # Loaded plugins with enabled set, kept in step with load/unload
+        self._enabled_plugins: List[BasePlugin] = []
+        # path -> (mtime, module, plugin class) of the last executed version
+        # of each plugin file; one entry per path, replaced when it changes
+        self._class_cache: Dict[str, Tuple[float, Any, type]] = {}
     
     def discover_plugins(self) -> List[str]:
         """
@@ -48,12 +57,14 @@ class PluginManager:
         logger.info(f"Discovered {len(plugin_files)} plugin files")
         return plugin_files
     
-    def load_plugin(self, plugin_path: str) -> bool:
+    def load_plugin(self, plugin_path: str, use_cache: bool = True) -> bool:
         """
         Load a plugin from file
         
         Args:
             plugin_path: Path to plugin .py file
+            use_cache: Reuse the module of an unchanged file instead of
+                executing it again
         
         Returns:
             True if loaded successfully, False otherwise
@@ -68,29 +79,36 @@ class PluginManager:
             # Generate module name
             module_name = f"plugin_{plugin_path.stem}"
             
-            # Load module
-            spec = importlib.util.spec_from_file_location(module_name, plugin_path)
-            if not spec or not spec.loader:
-                logger.error(f"Failed to load plugin spec: {plugin_path}")
-                return False
-            
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            
-            # Find plugin class (subclass of BasePlugin)
-            plugin_class = None
-            for name in dir(module):
-                obj = getattr(module, name)
-                if (isinstance(obj, type) and 
-                    issubclass(obj, BasePlugin) and 
-                    obj is not BasePlugin):
-                    plugin_class = obj
-                    break
-            
-            if not plugin_class:
-                logger.error(f"No plugin class found in {plugin_path}")
-                return False
+            # Unchanged file already executed: reuse its module and class
+            cache_key = str(plugin_path.resolve())
+            mtime = plugin_path.stat().st_mtime
+            cached = self._class_cache.get(cache_key) if use_cache else None
+            if cached and cached[0] == mtime:
+                _, module, plugin_class = cached
+                sys.modules[module_name] = module
+            else:
+                # Load module
+                spec = importlib.util.spec_from_file_location(module_name, plugin_path)
+                if not spec or not spec.loader:
+                    logger.error(f"Failed to load plugin spec: {plugin_path}")
+                    return False
+                
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                
+                # Find plugin class (subclass of BasePlugin)
+                plugin_class = next(
+                    (obj for obj in vars(module).values()
+                     if isinstance(obj, type) and obj is not BasePlugin and issubclass(obj, BasePlugin)),
+                    None
+                )
+                
+                if not plugin_class:
+                    logger.error(f"No plugin class found in {plugin_path}")
+                    return False
+                
+                self._class_cache[cache_key] = (mtime, module, plugin_class)
             
             # Instantiate plugin
             plugin = plugin_class()
@@ -98,8 +116,10 @@ class PluginManager:
             # Call on_load
             if plugin.on_load():
                 plugin.enabled = True
-                self.plugins[plugin.name] = plugin
-                self.plugin_modules[plugin.name] = module_name
+                with self._plugins_lock:
+                    self.plugins[plugin.name] = plugin
+                    self.plugin_modules[plugin.name] = module_name
+                    self._enabled_plugins.append(plugin)
                 logger.info(f"Loaded plugin: {plugin.name} v{plugin.version}")
                 return True
             else:
@@ -131,7 +151,9 @@ class PluginManager:
             plugin.on_unload()
             
             # Remove from plugins dict
-            del self.plugins[plugin_name]
+            with self._plugins_lock:
+                del self.plugins[plugin_name]
+                self._enabled_plugins = [p for p in self._enabled_plugins if p is not plugin]
             
             # Remove module
             if plugin_name in self.plugin_modules:
@@ -164,8 +186,8 @@ class PluginManager:
         if plugin_name in self.plugins:
             self.unload_plugin(plugin_name)
         
-        # Load again
-        return self.load_plugin(plugin_path)
+        # Load again, always re-executing the module so its state is reset
+        return self.load_plugin(plugin_path, use_cache=False)
     
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
         """Get plugin by name"""
@@ -186,16 +208,22 @@ class PluginManager:
         Returns:
             List of results from plugins
         """
+        enabled_plugins = self._enabled_plugins
+        if not enabled_plugins:
+            return []
+        
         results = []
         
-        for plugin_name, plugin in self.plugins.items():
-            if plugin.enabled:
-                try:
-                    result = plugin.on_action(action, context)
-                    if result is not None:
-                        results.append(result)
-                except Exception as e:
-                    logger.error(f"Plugin {plugin_name} action hook failed: {e}")
+        for plugin in enabled_plugins:
+            # A plugin may still be switched off directly via its flag
+            if not plugin.enabled:
+                continue
+            try:
+                result = plugin.on_action(action, context)
+                if result is not None:
+                    results.append(result)
+            except Exception as e:
+                logger.error(f"Plugin {plugin.name} action hook failed: {e}")
         
         return results
     
@@ -209,9 +237,11 @@ class PluginManager:
         plugin_files = self.discover_plugins()
         loaded_count = 0
         
-        for plugin_path in plugin_files:
-            if self.load_plugin(plugin_path):
-                loaded_count += 1
+        # Plugin imports are independent and mostly disk/compile bound
+        if plugin_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(plugin_files)),
+                                    thread_name_prefix="plugin-load") as executor:
+                loaded_count = sum(executor.map(self.load_plugin, plugin_files))
         
         logger.info(f"Loaded {loaded_count} of {len(plugin_files)} plugins")
         return loaded_count
@@ -5,10 +5,25 @@ Template Manager for Curios Agent
 Manages action templates - ready-made automation scenarios
 """
 
+import copy
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=8)
+def _load_templates_cached(path: str, mtime: float) -> Tuple[Dict, ...]:
+    """
+    Parse a templates file; mtime is part of the key so edits reparse
+    
+    The parsed dicts are shared by every caller, so never hand them out
+    without copying.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return tuple(data.get("templates", []))
 
 
 class TemplateManager:
@@ -16,42 +31,87 @@ class TemplateManager:
     
     def __init__(self, templates_file: str = "templates/default_templates.json"):
         self.templates_file = templates_file
+        self._by_name: Dict[str, Dict] = {}
+        self._by_category: Dict[str, List[Dict]] = {}
+        self._categories_sorted: Tuple[str, ...] = ()
+        self._localized_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._key_for_lang: Dict[str, Tuple[str, str]] = {}
         self.templates = self.load_templates()
+        self._rebuild_index()
     
     def load_templates(self) -> List[Dict]:
         """Load templates from file"""
         try:
             if os.path.exists(self.templates_file):
-                with open(self.templates_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get("templates", [])
+                mtime = os.stat(self.templates_file).st_mtime
+                # Deep copy: each manager may mutate its own template dicts
+                return copy.deepcopy(list(_load_templates_cached(self.templates_file, mtime)))
         except Exception as e:
             print(f"Failed to load templates: {e}")
         
         return []
     
+    def _rebuild_index(self):
+        """Rebuild name/category lookups; call after mutating self.templates"""
+        by_name = {}
+        by_category = {}
+        for template in self.templates:
+            if "name" in template:
+                by_name.setdefault(template["name"], template)
+            if "category" in template:
+                by_category.setdefault(template["category"], []).append(template)
+        self._by_name = by_name
+        self._by_category = by_category
+        self._categories_sorted = tuple(sorted(by_category))
+        self._localized_cache.clear()
+    
     def get_template(self, name: str) -> Optional[Dict]:
         """Get template by name"""
-        for template in self.templates:
-            if template.get("name") == name:
-                return template
-        return None
+        return self._by_name.get(name)
     
     def get_all_templates(self) -> List[Dict]:
         """Get all templates"""
         return self.templates
     
     def get_templates_by_category(self, category: str) -> List[Dict]:
-        """Get templates by category"""
-        return [t for t in self.templates if t.get("category") == category]
+        """Get templates by category (a new list; the index is not exposed)"""
+        return list(self._by_category.get(category, ()))
     
-    def get_categories(self) -> List[str]:
-        """Get all unique categories"""
-        categories = set()
-        for template in self.templates:
-            if "category" in template:
-                categories.add(template["category"])
-        return sorted(list(categories))
+    def get_categories(self) -> Tuple[str, ...]:
+        """Get all unique categories, sorted"""
+        return self._categories_sorted
+    
+    def get_localized(self, template: Dict, lang: str) -> Tuple[str, str]:
+        """
+        Get template name and description in the given language
+        
+        Args:
+            template: Template dict from this manager
+            lang: Language code, e.g. "en"
+            
+        Returns:
+            (name, description) with English/plain-name fallbacks
+        """
+        # Keyed by the template's id (or plain name) and language; templates
+        # with neither are looked up without caching
+        template_key = template.get("id") or template.get("name")
+        cache_key = (template_key, lang)
+        cached = self._localized_cache.get(cache_key) if template_key else None
+        if cached is not None:
+            return cached
+        
+        keys = self._key_for_lang.get(lang)
+        if keys is None:
+            keys = self._key_for_lang[lang] = (f"name_{lang}", f"description_{lang}")
+        name_key, desc_key = keys
+        
+        localized = (
+            template.get(name_key, template.get("name", "Unknown")),
+            template.get(desc_key, template.get("description_en", "")),
+        )
+        if template_key:
+            self._localized_cache[cache_key] = localized
+        return localized
     
     def execute_template(self, template: Dict) -> str:
         """Convert template to instruction text"""
@@ -0,0 +1,37 @@
+import pytest
+
+# curios_agent exits at import without its GUI/automation dependencies
+for _module in ("customtkinter", "pyautogui", "pydirectinput", "google.generativeai", "PIL"):
+    pytest.importorskip(_module)
+
+import curios_agent as agent
+
+
+# (verb, argument count, fast-path cast, regex, regex group cast)
+CASES = [
+    ("move_mouse", 2, agent._parse_count, agent._MOVE_MOUSE_RE, int),
+    ("drag", 4, agent._parse_count, agent._DRAG_RE, int),
+    ("scroll", 1, agent._parse_offset, agent._SCROLL_RE, int),
+    ("wait", 1, agent._parse_seconds, agent._WAIT_RE, float),
+]
+
+ARGUMENTS = {
+    "move_mouse": ["10,20", "10, 20", "10,  20", " 10,20", "10 ,20", "10,20 ",
+                   "-5,3", "+5,3", "1_0,3", "1.5,3", "10", "10,20,30", ""],
+    "drag": ["1,2,3,4", "1, 2, 3, 4", "1,2,3", " 1,2,3,4", "1,2,3,-4", "1,2,3,4 "],
+    "scroll": ["3", "-3", " -3", "-3 ", "- 3", "+3", "--3", "", "1_0"],
+    "wait": ["2", "1.5", ".5", "1.", "2 ", " 2", "1.2.3", "-1", "1e3", "", "٣"],
+}
+
+
+def _regex_path(action, regex, group_cast):
+    match = regex.search(action)
+    return [group_cast(g) for g in match.groups()] if match else None
+
+
+@pytest.mark.parametrize("verb,count,cast,regex,group_cast", CASES)
+def test_fast_path_matches_regex_path(verb, count, cast, regex, group_cast) -> None:
+    for args in ARGUMENTS[verb]:
+        action = f"{verb}({args})"
+        fast = agent._parse_call_args(action, verb, count, cast=cast)
+        assert fast == _regex_path(action, regex, group_cast), action
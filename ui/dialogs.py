@@ -5,9 +5,11 @@ Dialogs Module
 Legal Notice and EULA dialogs
 """
 
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Tuple
 
 try:
     import customtkinter as ctk
@@ -18,149 +20,379 @@ from ui.theme import Theme
 
 logger = logging.getLogger(__name__)
 
+# Widget classes resolved once instead of two attribute lookups per widget
+_CTkLabel = ctk.CTkLabel if ctk else None
+_CTkButton = ctk.CTkButton if ctk else None
+_CTkTextbox = ctk.CTkTextbox if ctk else None
+_CTkFrame = ctk.CTkFrame if ctk else None
+_CTkToplevel = ctk.CTkToplevel if ctk else None
+_CTk = ctk.CTk if ctk else None
 
-class LegalDialog:
+# Shown when the document file is missing or unreadable
+DEFAULT_LEGAL = """LEGAL NOTICE
+
+This software is provided for educational and research purposes only.
+
+By using this software, you acknowledge and agree that:
+
+1. You are solely responsible for compliance with all applicable laws and regulations
+2. The authors are not liable for any misuse or damages
+3. This software must not be used for unauthorized access or malicious purposes
+4. You will use this software ethically and responsibly
+
+If you do not agree with these terms, you must not use this software.
+"""
+
+DEFAULT_EULA = """END USER LICENSE AGREEMENT (EULA)
+
+For FAIR_PLAY and CURIOS Operation Modes
+
+By accepting this agreement, you acknowledge that:
+
+1. FAIR_PLAY Mode:
+   - Designed for game automation with human-like behavior
+   - Must only be used in Virtual Machine environments
+   - May violate game Terms of Service
+   - You are responsible for any consequences
+
+2. CURIOS Mode:
+   - Sandbox mode with reduced restrictions
+   - Must only be used in Virtual Machine environments
+   - Intended for research and testing
+   - Not for production use
+
+3. General Terms:
+   - You will only use these modes in VM environments
+   - You accept all risks and liability
+   - Authors are not responsible for misuse
+   - You will comply with all applicable laws
+
+If you do not accept these terms, FAIR_PLAY and CURIOS modes will remain disabled.
+"""
+
+# Dialog fonts, shared by every dialog instead of rebuilt per show()
+_FONT_TITLE = ("Arial", 20, "bold")
+_FONT_BTN = ("Arial", 14, "bold")
+
+# Characters inserted into the document textbox per UI-thread step
+_TEXT_CHUNK = 65536
+
+# path -> (mtime, text) of documents already read
+_FILE_CACHE: Dict[str, Tuple[float, str]] = {}
+
+# Reads documents ahead of time so show() never waits on the disk
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dialog-prefetch")
+
+
+def _read_small(path: Path) -> str:
+    """Read a small UTF-8 text file with raw os reads (no TextIOWrapper)"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            data = os.read(fd, max(size, 1))
+            if not data:
+                break
+            chunks.append(data)
+    finally:
+        os.close(fd)
+    
+    text = b"".join(chunks).decode('utf-8')
+    # Same newline handling as text-mode reads
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_cached(path: Path, fallback: str) -> str:
     """
-    Legal Notice Dialog
-    Blocks application startup until accepted
+    Read a text document, re-reading only when its mtime changes
+    
+    Args:
+        path: Document path
+        fallback: Text returned if the file is missing or unreadable
+    
+    Returns:
+        Document text
     """
+    key = str(path)
+    try:
+        mtime = path.stat().st_mtime
+        cached = _FILE_CACHE.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        text = _read_small(path)
+        _FILE_CACHE[key] = (mtime, text)
+        return text
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to load {path}: {e}")
     
-    def __init__(self, parent=None, translations: dict = None):
+    return fallback
+
+
+def _load_prefetched(dialog_class, path: Path, fallback: str) -> str:
+    """
+    Take a dialog's prefetched document text, or read it now
+    
+    Args:
+        dialog_class: Dialog class whose prefetch() may have started a read
+        path: Document path
+        fallback: Text returned if the file is missing or unreadable
+    
+    Returns:
+        Document text
+    """
+    future = dialog_class._text_future
+    if future is not None:
+        dialog_class._text_future = None
+        try:
+            return future.result(timeout=0.01)
+        except Exception:
+            pass  # Still reading (or failed): fall back to a direct read
+    
+    return _read_cached(path, fallback)
+
+
+class _AcceptWindow:
+    """Widget tree of one accept/decline document window"""
+    
+    def __init__(self, parent=None):
         """
-        Initialize Legal Notice dialog
+        Build the window (hidden until show() for parented windows)
         
         Args:
-            parent: Parent window (None for standalone)
-            translations: Translation dictionary
+            parent: Parent window (None for a standalone window)
         """
         self.parent = parent
-        self.translations = translations or {}
+        self.text = None
         self.accepted = False
-    
-    def show(self) -> bool:
-        """
-        Show Legal Notice dialog
-        Application will NOT start until accepted
-        
-        Returns:
-            True if accepted, False if declined
-        """
-        if ctk is None:
-            logger.error("CustomTkinter not available")
-            return False
         
         # Create toplevel dialog
-        if self.parent:
-            dialog = ctk.CTkToplevel(self.parent)
+        if parent:
+            dialog = _CTkToplevel(parent)
+            dialog.withdraw()
         else:
-            dialog = ctk.CTk()
+            dialog = _CTk()
             ctk.set_appearance_mode("dark")
         
-        dialog.title(self.translations.get("legal_notice_title", "Legal Notice"))
         dialog.geometry("850x650")
-        
-        # Make modal
-        if self.parent:
-            dialog.transient(self.parent)
-            dialog.grab_set()
-        
-        # Configure colors
         dialog.configure(fg_color=Theme.BG_PRIMARY)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._close(False))
+        self.dialog = dialog
+        self.answer_var = ctk.BooleanVar(dialog, value=False)
+        
+        # Destroyed from outside (e.g. the parent closed): stop waiting
+        dialog.bind("<Destroy>", self._on_destroy, add="+")
         
         # Title
-        title_label = ctk.CTkLabel(
+        self.title_label = _CTkLabel(
             dialog,
-            text=self.translations.get("legal_notice_title", "Legal Notice"),
-            font=("Arial", 20, "bold"),
+            font=_FONT_TITLE,
             text_color=Theme.TEXT_PRIMARY
         )
-        title_label.pack(pady=20)
-        
-        # Read legal notice content
-        legal_text = self._load_legal_notice()
+        self.title_label.pack(pady=20)
         
         # Text widget with scrollbar
-        text_widget = ctk.CTkTextbox(
+        self.text_widget = _CTkTextbox(
             dialog,
             width=800,
             height=450,
             fg_color=Theme.BG_SECONDARY,
             text_color=Theme.TEXT_PRIMARY,
             border_color=Theme.BORDER,
-            border_width=1
+            border_width=1,
+            undo=False
         )
-        text_widget.pack(padx=20, pady=10)
-        text_widget.insert("1.0", legal_text)
-        text_widget.configure(state="disabled")
+        self.text_widget.pack(padx=20, pady=10)
         
         # Button frame
-        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame = _CTkFrame(dialog, fg_color="transparent")
         button_frame.pack(pady=20)
         
-        def on_accept():
-            self.accepted = True
-            dialog.destroy()
-        
-        def on_decline():
-            self.accepted = False
-            dialog.destroy()
-        
-        # Accept button
-        accept_btn = ctk.CTkButton(
-            button_frame,
-            text=self.translations.get("legal_notice_accept", "I have read and agree"),
-            command=on_accept,
-            width=220,
-            height=45,
-            font=("Arial", 14, "bold"),
-            fg_color=Theme.BTN_PRIMARY_BG,
-            hover_color=Theme.BTN_PRIMARY_HOVER
+        # Accept and decline buttons
+        self.buttons = []
+        buttons = (
+            (True, Theme.BTN_PRIMARY_BG, Theme.BTN_PRIMARY_HOVER),
+            (False, Theme.BTN_DANGER_BG, Theme.BTN_DANGER_HOVER),
         )
-        accept_btn.pack(side="left", padx=10)
+        for answer, color, hover in buttons:
+            button = _CTkButton(
+                button_frame,
+                command=lambda answer=answer: self._close(answer),
+                width=220,
+                height=45,
+                font=_FONT_BTN,
+                fg_color=color,
+                hover_color=hover
+            )
+            button.pack(side="left", padx=10)
+            self.buttons.append(button)
+    
+    def is_reusable_for(self, parent) -> bool:
+        """Check whether this pooled window can be shown again for parent"""
+        try:
+            return self.parent is parent and bool(self.dialog.winfo_exists())
+        except Exception:
+            return False
+    
+    def show(self, title: str, text: str, accept_text: str, decline_text: str) -> bool:
+        """
+        Show the window modally and wait for an answer
         
-        # Decline button
-        decline_btn = ctk.CTkButton(
-            button_frame,
-            text=self.translations.get("legal_notice_decline", "Decline"),
-            command=on_decline,
-            width=220,
-            height=45,
-            font=("Arial", 14, "bold"),
-            fg_color=Theme.BTN_DANGER_BG,
-            hover_color=Theme.BTN_DANGER_HOVER
-        )
-        decline_btn.pack(side="left", padx=10)
+        Parented windows are withdrawn afterwards for reuse; a standalone
+        window is destroyed.
+        
+        Returns:
+            True if accepted, False if declined or closed
+        """
+        dialog = self.dialog
+        dialog.title(title)
+        self.title_label.configure(text=title)
+        self.buttons[0].configure(text=accept_text)
+        self.buttons[1].configure(text=decline_text)
+        if text is not self.text:
+            self._fill(text)
         
-        # Wait for dialog to close
+        self.accepted = False
         if self.parent:
-            dialog.wait_window()
-        else:
-            dialog.mainloop()
+            dialog.deiconify()
+            # Make modal: transient + grab in one Tcl round-trip (window
+            # paths are plain Tk names, so no quoting is needed)
+            dialog.tk.eval(f"wm transient {dialog._w} {self.parent.winfo_toplevel()._w}; grab set {dialog._w}")
+        
+        # Blocking tkwait instead of running a full mainloop
+        dialog.wait_variable(self.answer_var)
+        
+        if self.is_reusable_for(self.parent):
+            if self.parent:
+                dialog.grab_release()
+                dialog.withdraw()
+            else:
+                dialog.destroy()
         
         return self.accepted
     
-    def _load_legal_notice(self) -> str:
-        """Load legal notice from file"""
-        legal_file = Path("LEGAL_NOTICE.md")
-        try:
-            if legal_file.exists():
-                return legal_file.read_text(encoding='utf-8')
-        except Exception as e:
-            logger.error(f"Failed to load LEGAL_NOTICE.md: {e}")
+    def _fill(self, text: str):
+        """Replace the document text, inserting large documents in chunks"""
+        self.text = text
+        text_widget = self.text_widget
+        
+        # The first chunk goes in now so the dialog paints at once; the rest
+        # of a large document is appended from idle callbacks
+        text_widget.configure(state="normal")
+        text_widget.delete("1.0", "end")
+        text_widget.insert("1.0", text[:_TEXT_CHUNK])
+        text_widget.configure(state="disabled")
         
-        return """LEGAL NOTICE
+        def insert_next_chunk(offset: int):
+            # Stop if the window closed or another document replaced this one
+            if offset >= len(text) or self.text is not text or not text_widget.winfo_exists():
+                return
+            text_widget.configure(state="normal")
+            text_widget.insert("end", text[offset:offset + _TEXT_CHUNK])
+            text_widget.configure(state="disabled")
+            self.dialog.after_idle(insert_next_chunk, offset + _TEXT_CHUNK)
+        
+        if len(text) > _TEXT_CHUNK:
+            self.dialog.after_idle(insert_next_chunk, _TEXT_CHUNK)
+    
+    def _close(self, answer: bool):
+        """Record the answer; writing the variable ends the wait in show()"""
+        self.accepted = answer
+        self.answer_var.set(answer)
+    
+    def _on_destroy(self, event):
+        """Release show() if the window is destroyed while waiting"""
+        if event.widget is self.dialog:
+            self.answer_var.set(self.accepted)
 
-This software is provided for educational and research purposes only.
 
-By using this software, you acknowledge and agree that:
+# Parented accept windows kept hidden between uses, by dialog kind
+_DIALOG_POOL: Dict[str, _AcceptWindow] = {}
 
-1. You are solely responsible for compliance with all applicable laws and regulations
-2. The authors are not liable for any misuse or damages
-3. This software must not be used for unauthorized access or malicious purposes
-4. You will use this software ethically and responsibly
 
-If you do not agree with these terms, you must not use this software.
-"""
+def _show_accept_dialog(parent, kind: str, title: str, text: str,
+                        accept_text: str, decline_text: str) -> bool:
+    """
+    Show a modal document with accept/decline buttons
+    
+    Args:
+        parent: Parent window (None for a standalone window)
+        kind: Pool key; parented windows of the same kind are reused
+        title: Window and heading title
+        text: Document text
+        accept_text: Accept button label
+        decline_text: Decline button label
+    
+    Returns:
+        True if accepted, False if declined or closed
+    """
+    if ctk is None:
+        logger.error("CustomTkinter not available")
+        return False
+    
+    window = _DIALOG_POOL.get(kind) if parent else None
+    if window is None or not window.is_reusable_for(parent):
+        window = _AcceptWindow(parent)
+        if parent:
+            _DIALOG_POOL[kind] = window
+    
+    return window.show(title, text, accept_text, decline_text)
+
+
+class LegalDialog:
+    """
+    Legal Notice Dialog
+    Blocks application startup until accepted
+    """
+    
+    _text_future = None
+    
+    @classmethod
+    def prefetch(cls):
+        """Start reading LEGAL_NOTICE.md in the background"""
+        if cls._text_future is None:
+            cls._text_future = _PREFETCH_EXECUTOR.submit(
+                _read_cached, Path("LEGAL_NOTICE.md"), DEFAULT_LEGAL
+            )
+    
+    def __init__(self, parent=None, translations: dict = None):
+        """
+        Initialize Legal Notice dialog
+        
+        Args:
+            parent: Parent window (None for standalone)
+            translations: Translation dictionary
+        """
+        self.parent = parent
+        self.translations = translations or {}
+        self.accepted = False
+    
+    def show(self) -> bool:
+        """
+        Show Legal Notice dialog
+        Application will NOT start until accepted
+        
+        Returns:
+            True if accepted, False if declined
+        """
+        t = self.translations.get
+        title_text = t("legal_notice_title", "Legal Notice")
+        accept_text = t("legal_notice_accept", "I have read and agree")
+        decline_text = t("legal_notice_decline", "Decline")
+        
+        self.accepted = _show_accept_dialog(
+            self.parent, "legal", title_text, self._load_legal_notice(),
+            accept_text, decline_text
+        )
+        return self.accepted
+    
+    def _load_legal_notice(self) -> str:
+        """Load legal notice from file"""
+        return _load_prefetched(LegalDialog, Path("LEGAL_NOTICE.md"), DEFAULT_LEGAL)
 
 
 class EULADialog:
@@ -169,6 +401,16 @@ class EULADialog:
     Required before enabling these modes
     """
     
+    _text_future = None
+    
+    @classmethod
+    def prefetch(cls):
+        """Start reading EULA.md in the background"""
+        if cls._text_future is None:
+            cls._text_future = _PREFETCH_EXECUTOR.submit(
+                _read_cached, Path("EULA.md"), DEFAULT_EULA
+            )
+    
     def __init__(self, parent, translations: dict = None):
         """
         Initialize EULA dialog
@@ -189,126 +431,32 @@ class EULADialog:
         Returns:
             True if accepted, False if declined
         """
-        if ctk is None:
-            logger.error("CustomTkinter not available")
-            return False
-        
-        # Create toplevel dialog
-        dialog = ctk.CTkToplevel(self.parent)
-        dialog.title(self.translations.get("eula_title", "End User License Agreement"))
-        dialog.geometry("850x650")
-        
-        # Make modal
-        dialog.transient(self.parent)
-        dialog.grab_set()
-        
-        # Configure colors
-        dialog.configure(fg_color=Theme.BG_PRIMARY)
-        
-        # Title
-        title_label = ctk.CTkLabel(
-            dialog,
-            text=self.translations.get("eula_title", "End User License Agreement"),
-            font=("Arial", 20, "bold"),
-            text_color=Theme.TEXT_PRIMARY
-        )
-        title_label.pack(pady=20)
-        
-        # Read EULA content
-        eula_text = self._load_eula()
-        
-        # Text widget
-        text_widget = ctk.CTkTextbox(
-            dialog,
-            width=800,
-            height=450,
-            fg_color=Theme.BG_SECONDARY,
-            text_color=Theme.TEXT_PRIMARY,
-            border_color=Theme.BORDER,
-            border_width=1
-        )
-        text_widget.pack(padx=20, pady=10)
-        text_widget.insert("1.0", eula_text)
-        text_widget.configure(state="disabled")
-        
-        # Button frame
-        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        button_frame.pack(pady=20)
-        
-        def on_accept():
-            self.accepted = True
-            dialog.destroy()
-        
-        def on_decline():
-            self.accepted = False
-            dialog.destroy()
-        
-        # Accept button
-        accept_btn = ctk.CTkButton(
-            button_frame,
-            text=self.translations.get("eula_accept", "I accept the EULA"),
-            command=on_accept,
-            width=220,
-            height=45,
-            font=("Arial", 14, "bold"),
-            fg_color=Theme.BTN_PRIMARY_BG,
-            hover_color=Theme.BTN_PRIMARY_HOVER
+        t = self.translations.get
+        title_text = t("eula_title", "End User License Agreement")
+        accept_text = t("eula_accept", "I accept the EULA")
+        decline_text = t("eula_decline", "Decline")
+        
+        self.accepted = _show_accept_dialog(
+            self.parent, "eula", title_text, self._load_eula(),
+            accept_text, decline_text
         )
-        accept_btn.pack(side="left", padx=10)
-        
-        # Decline button
-        decline_btn = ctk.CTkButton(
-            button_frame,
-            text=self.translations.get("eula_decline", "Decline"),
-            command=on_decline,
-            width=220,
-            height=45,
-            font=("Arial", 14, "bold"),
-            fg_color=Theme.BTN_DANGER_BG,
-            hover_color=Theme.BTN_DANGER_HOVER
-        )
-        decline_btn.pack(side="left", padx=10)
-        
-        # Wait for dialog to close
-        dialog.wait_window()
-        
         return self.accepted
     
     def _load_eula(self) -> str:
         """Load EULA from file"""
-        eula_file = Path("EULA.md")
-        try:
-            if eula_file.exists():
-                return eula_file.read_text(encoding='utf-8')
-        except Exception as e:
-            logger.error(f"Failed to load EULA.md: {e}")
-        
-        return """END USER LICENSE AGREEMENT (EULA)
-
-For FAIR_PLAY and CURIOS Operation Modes
-
-By accepting this agreement, you acknowledge that:
+        return _load_prefetched(EULADialog, Path("EULA.md"), DEFAULT_EULA)
 
-1. FAIR_PLAY Mode:
-   - Designed for game automation with human-like behavior
-   - Must only be used in Virtual Machine environments
-   - May violate game Terms of Service
-   - You are responsible for any consequences
 
-2. CURIOS Mode:
-   - Sandbox mode with reduced restrictions
-   - Must only be used in Virtual Machine environments
-   - Intended for research and testing
-   - Not for production use
+_messagebox = None
 
-3. General Terms:
-   - You will only use these modes in VM environments
-   - You accept all risks and liability
-   - Authors are not responsible for misuse
-   - You will comply with all applicable laws
 
-If you do not accept these terms, FAIR_PLAY and CURIOS modes will remain disabled.
-"""
+def _mb():
+    """Import tkinter.messagebox on first use and reuse it afterwards"""
+    global _messagebox
+    if _messagebox is None:
+        from tkinter import messagebox
+        _messagebox = messagebox
+    return _messagebox
 
 
 def show_error_dialog(parent, title: str, message: str):
@@ -321,8 +469,7 @@ def show_error_dialog(parent, title: str, message: str):
         message: Error message
     """
     try:
-        from tkinter import messagebox
-        messagebox.showerror(title, message, parent=parent)
+        _mb().showerror(title, message, parent=parent)
     except Exception as e:
         logger.error(f"Failed to show error dialog: {e}")
 
@@ -337,8 +484,7 @@ def show_info_dialog(parent, title: str, message: str):
         message: Info message
     """
     try:
-        from tkinter import messagebox
-        messagebox.showinfo(title, message, parent=parent)
+        _mb().showinfo(title, message, parent=parent)
     except Exception as e:
         logger.error(f"Failed to show info dialog: {e}")
 
@@ -356,8 +502,7 @@ def show_confirm_dialog(parent, title: str, message: str) -> bool:
         True if confirmed, False otherwise
     """
     try:
-        from tkinter import messagebox
-        return messagebox.askyesno(title, message, parent=parent)
+        return _mb().askyesno(title, message, parent=parent)
     except Exception as e:
         logger.error(f"Failed to show confirm dialog: {e}")
         return False
@@ -5,6 +5,8 @@ GitHub Dark Theme
 Provides color scheme matching GitHub's dark mode
 """
 
+from types import MappingProxyType
+
 
 class Theme:
     """GitHub Dark theme colors and styling"""
@@ -69,17 +71,10 @@ class Theme:
         Get color configuration for CustomTkinter
         
         Returns:
-            Dictionary with color mappings for CTk widgets
+            Dictionary with color mappings for CTk widgets (a fresh copy
+            callers may update with per-widget overrides)
         """
-        return {
-            "fg_color": cls.BG_SECONDARY,
-            "bg_color": cls.BG_PRIMARY,
-            "border_color": cls.BORDER,
-            "button_color": cls.BTN_SECONDARY_BG,
-            "button_hover_color": cls.BTN_SECONDARY_HOVER,
-            "text_color": cls.TEXT_PRIMARY,
-            "text_color_disabled": cls.TEXT_MUTED,
-        }
+        return dict(_CTK_COLORS)
     
     @classmethod
     def get_mode_color(cls, mode: str) -> str:
@@ -92,12 +87,7 @@ class Theme:
         Returns:
             Color hex string
         """
-        mode_colors = {
-            "NORMAL": cls.MODE_NORMAL,
-            "FAIR_PLAY": cls.MODE_FAIR_PLAY,
-            "CURIOS": cls.MODE_CURIOS,
-        }
-        return mode_colors.get(mode, cls.TEXT_SECONDARY)
+        return _MODE_COLORS.get(mode, cls.TEXT_SECONDARY)
     
     @classmethod
     def get_status_color(cls, status: str) -> str:
@@ -110,14 +100,37 @@ class Theme:
         Returns:
             Color hex string
         """
-        status_colors = {
-            "success": cls.STATUS_SUCCESS,
-            "warning": cls.STATUS_WARNING,
-            "error": cls.STATUS_ERROR,
-            "info": cls.STATUS_INFO,
-            "idle": cls.STATUS_IDLE,
-            "ready": cls.STATUS_SUCCESS,
-            "executing": cls.STATUS_INFO,
-            "stopped": cls.STATUS_WARNING,
-        }
-        return status_colors.get(status.lower(), cls.TEXT_SECONDARY)
+        # Already-lowercase names (the usual case) skip the lower() copy
+        color = _STATUS_COLORS.get(status)
+        if color is None and not status.islower():
+            color = _STATUS_COLORS.get(status.lower())
+        return color or cls.TEXT_SECONDARY
+
+
+# Lookup tables built once at import (see the Theme methods above)
+_CTK_COLORS = MappingProxyType({
+    "fg_color": Theme.BG_SECONDARY,
+    "bg_color": Theme.BG_PRIMARY,
+    "border_color": Theme.BORDER,
+    "button_color": Theme.BTN_SECONDARY_BG,
+    "button_hover_color": Theme.BTN_SECONDARY_HOVER,
+    "text_color": Theme.TEXT_PRIMARY,
+    "text_color_disabled": Theme.TEXT_MUTED,
+})
+
+_MODE_COLORS = {
+    "NORMAL": Theme.MODE_NORMAL,
+    "FAIR_PLAY": Theme.MODE_FAIR_PLAY,
+    "CURIOS": Theme.MODE_CURIOS,
+}
+
+_STATUS_COLORS = {
+    "success": Theme.STATUS_SUCCESS,
+    "warning": Theme.STATUS_WARNING,
+    "error": Theme.STATUS_ERROR,
+    "info": Theme.STATUS_INFO,
+    "idle": Theme.STATUS_IDLE,
+    "ready": Theme.STATUS_SUCCESS,
+    "executing": Theme.STATUS_INFO,
+    "stopped": Theme.STATUS_WARNING,
+}